@@ -1,14 +1,29 @@
-from flask import Flask, request, jsonify, render_template, send_from_directory
+from flask import Flask, request, jsonify, render_template, send_from_directory, send_file, Response, stream_with_context
 from flask_cors import CORS
 from werkzeug.utils import secure_filename
+from werkzeug.exceptions import RequestEntityTooLarge
+from sqlalchemy.orm import defer
 import os
 import json
-from datetime import datetime
+import gzip
+import hashlib
+import time
+import click
+import numpy as np
+from datetime import datetime, timedelta, timezone
 
 from config import Config
-from models import db, Resume, JobDescription, Screening
+from models import db, Resume, JobDescription, Screening, Tombstone
 from utils.pdf_parser import ResumeParser
 from utils.ml_matcher import ResumeJobMatcher
+from utils.executor import ScreeningExecutor
+from utils.job_profile import JobProfileCache
+from utils.candidate_table import CandidateTable
+from utils.shards import ShardCoordinator, parse_addresses, RANK_FIELDS
+from utils.upload import UploadRejected, stream_upload, TEMP_PREFIX, LEGACY_DOC_MESSAGE
+from utils.blob_store import BlobStore
+from utils.export import EXPORT_FORMATS, export_chunks
+from utils.vector_store import ResumeVectorStore, resume_feature_vector, FEATURE_SKILLS
 
 app = Flask(__name__)
 app.config.from_object(Config)
@@ -23,6 +38,41 @@ os.makedirs(app.config['MODEL_PATH'], exist_ok=True)
 
 # Initialize ML matcher
 matcher = ResumeJobMatcher()
+executor = ScreeningExecutor(
+    matcher,
+    workers=app.config['SCREENING_WORKERS'],
+    chunk_size=app.config['SCREENING_CHUNK_SIZE']
+)
+# Workers start once, from a clean process, and serve every batch
+executor.start()
+
+# Optional sharded ranking across shard_worker.py processes
+shard_coordinator = None
+if app.config['SHARD_ADDRESSES']:
+    if not app.config['SHARD_AUTHKEY']:
+        # Shard replies are unpickled, so an unauthenticated peer could run code
+        raise RuntimeError('SHARD_AUTHKEY must be set when SHARD_ADDRESSES is configured')
+    shard_coordinator = ShardCoordinator(
+        parse_addresses(app.config['SHARD_ADDRESSES']),
+        authkey=app.config['SHARD_AUTHKEY'].encode(),
+        timeout=app.config['SHARD_TIMEOUT']
+    )
+
+# Compiled job descriptions, rebuilt when a job's updated_at changes
+job_profiles = JobProfileCache(app.config['JOB_PROFILE_CACHE_SIZE'])
+
+# Content-addressed storage for uploaded originals
+blob_store = BlobStore(app.config['UPLOAD_FOLDER'], app.config['BLOB_COMPRESSION'])
+
+# Memory-mapped resume feature vectors, shared by all worker processes
+vector_store = ResumeVectorStore(
+    app.config['VECTOR_STORE_PATH'],
+    dim=FEATURE_SKILLS + len(Config.COMMON_SKILLS),
+    compact_ratio=app.config['VECTOR_STORE_COMPACT_RATIO']
+)
+
+# Keeps the vector store in step with resumes written by any process
+candidate_table = CandidateTable(vector_store, Config.COMMON_SKILLS)
 
 def allowed_file(filename):
     """Check if file extension is allowed"""
@@ -30,6 +80,123 @@ def allowed_file(filename):
            filename.rsplit('.', 1)[1].lower() in app.config['ALLOWED_EXTENSIONS']
 
 
+def resume_match_data(resume):
+    """Convert a Resume row into the dict format used by the matcher"""
+    return {
+        'text': resume.extracted_text,
+        'skills': json.loads(resume.skills_found) if resume.skills_found else [],
+        'experience_years': resume.experience_years or 0,
+        'education': resume.education_level or 'Not Specified'
+    }
+
+
+def job_match_data(job):
+    """Convert a JobDescription row into the dict format used by the matcher"""
+    return {
+        'description': job.description,
+        'required_skills': json.loads(job.required_skills) if job.required_skills else [],
+        'preferred_skills': json.loads(job.preferred_skills) if job.preferred_skills else [],
+        'min_experience': job.min_experience or 0,
+        'education_required': job.education_required or 'Not Specified'
+    }
+
+
+def job_profile(job):
+    """Compiled JobProfile for a JobDescription row, cached per revision"""
+    return job_profiles.get(job.id, job.updated_at, lambda: matcher.compile_job(job_match_data(job)))
+
+
+def parse_since():
+    """Parse the optional ?since= cursor into a naive UTC datetime"""
+    since = request.args.get('since')
+    if not since:
+        return None
+    parsed = datetime.fromisoformat(since.replace('Z', '+00:00'))
+    if parsed.tzinfo is not None:
+        parsed = parsed.astimezone(timezone.utc).replace(tzinfo=None)
+    return parsed
+
+
+def next_cursor():
+    """Cursor for the client's next delta request, taken before querying"""
+    slack = timedelta(seconds=app.config['DELTA_CURSOR_SLACK_SECONDS'])
+    return (datetime.utcnow() - slack).isoformat()
+
+
+def collection_etag(*states):
+    """
+    Build an ETag from cheap aggregate table state
+    
+    The ETag deliberately ignores ?since=, so a delta client that sends its
+    last ETag gets a 304 whenever nothing changed, whatever its cursor.
+    """
+    return hashlib.sha1(repr(states).encode()).hexdigest()[:32]
+
+
+def collection_state(model, timestamp_column):
+    """Row count, newest timestamp and newest tombstone of a table"""
+    count, latest = db.session.query(db.func.count(model.id), db.func.max(timestamp_column)).one()
+    last_deleted = db.session.query(db.func.max(Tombstone.id)).filter_by(
+        table_name=model.__tablename__
+    ).scalar()
+    return count, latest, last_deleted
+
+
+def not_modified(etag):
+    """Return a 304 response if the client already holds this ETag"""
+    if request.if_none_match.contains_weak(etag):
+        response = Response(status=304)
+        response.set_etag(etag, weak=True)
+        return response
+    return None
+
+
+def conditional_jsonify(etag, payload):
+    response = jsonify(payload)
+    response.set_etag(etag, weak=True)
+    response.headers['Cache-Control'] = 'no-cache'
+    return response
+
+
+def deleted_since(model, since):
+    """
+    Ids of rows of model deleted after since
+    
+    Databases created before ids stopped being reused can hand a deleted id
+    to a new row; such ids are reported as live rows, not deletions.
+    """
+    return [row_id for (row_id,) in db.session.query(Tombstone.row_id).filter(
+        Tombstone.table_name == model.__tablename__,
+        Tombstone.deleted_at > since,
+        ~db.session.query(model.id).filter(model.id == Tombstone.row_id).exists()
+    ).distinct()]
+
+
+def record_tombstones(model, row_ids):
+    """Remember deleted rows for delta queries (committed with the delete)"""
+    db.session.add_all(Tombstone(table_name=model.__tablename__, row_id=row_id) for row_id in row_ids)
+
+
+@app.after_request
+def compress_response(response):
+    """Gzip JSON responses for clients that accept it"""
+    if (response.status_code != 200
+            or response.is_streamed
+            or response.mimetype != 'application/json'
+            or 'Content-Encoding' in response.headers
+            or 'gzip' not in request.headers.get('Accept-Encoding', '')):
+        return response
+    
+    data = response.get_data()
+    if len(data) < app.config['GZIP_MIN_SIZE']:
+        return response
+    
+    response.set_data(gzip.compress(data, compresslevel=app.config['GZIP_LEVEL']))
+    response.headers['Content-Encoding'] = 'gzip'
+    response.vary.add('Accept-Encoding')
+    return response
+
+
 # ==================== Routes ====================
 
 @app.route('/')
@@ -51,7 +218,11 @@ def health_check():
 @app.route('/api/upload-resume', methods=['POST'])
 def upload_resume():
     """Upload and parse resume"""
+    tmp_path = None
     try:
+        if request.content_length and request.content_length > app.config['MAX_CONTENT_LENGTH']:
+            return jsonify({'error': 'File too large'}), 413
+        
         if 'file' not in request.files:
             return jsonify({'error': 'No file provided'}), 400
         
@@ -60,54 +231,110 @@ def upload_resume():
         if file.filename == '':
             return jsonify({'error': 'No file selected'}), 400
         
+        if file.filename.lower().endswith('.doc'):
+            return jsonify({'error': LEGACY_DOC_MESSAGE}), 400
+        
         if not allowed_file(file.filename):
             return jsonify({'error': 'Invalid file type. Only PDF and DOCX allowed'}), 400
         
-        # Save file
+        # Stream to a temp file, rejecting bad content before it is parsed
         filename = secure_filename(file.filename)
-        timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-        unique_filename = f"{timestamp}_{filename}"
-        file_path = os.path.join(app.config['UPLOAD_FOLDER'], unique_filename)
-        file.save(file_path)
+        extension = filename.rsplit('.', 1)[1].lower()
+        tmp_path, file_hash, _ = stream_upload(
+            file.stream,
+            app.config['UPLOAD_FOLDER'],
+            expected_type=extension,
+            max_bytes=app.config['MAX_RESUME_SIZE'],
+            chunk_size=app.config['UPLOAD_CHUNK_SIZE']
+        )
         
         # Parse resume
-        parsed_data = ResumeParser.parse_resume(file_path, Config.COMMON_SKILLS)
-        
-        # Save to database
-        resume = Resume(
-            filename=unique_filename,
-            original_filename=filename,
-            file_path=file_path,
-            extracted_text=parsed_data['text'],
-            candidate_name=parsed_data['name'],
-            candidate_email=parsed_data['email'],
-            candidate_phone=parsed_data['phone'],
-            skills_found=json.dumps(parsed_data['skills']),
-            experience_years=parsed_data['experience_years'],
-            education_level=parsed_data['education']
-        )
+        parsed_data = ResumeParser.parse_resume(tmp_path, Config.COMMON_SKILLS)
         
-        db.session.add(resume)
+        resume = add_resume(tmp_path, file_hash, filename, parsed_data)
         db.session.commit()
         
+        vector_store.append(resume.id, resume_feature_vector(parsed_data, Config.COMMON_SKILLS))
+        
         return jsonify({
             'message': 'Resume uploaded and parsed successfully',
             'resume': resume.to_dict()
         }), 201
         
+    except UploadRejected as e:
+        return jsonify({'error': e.message}), e.status_code
+    except RequestEntityTooLarge:
+        return jsonify({'error': 'File too large'}), 413
     except Exception as e:
+        db.session.rollback()
         return jsonify({'error': str(e)}), 500
+    finally:
+        # Blobs orphaned by a failed commit are left for `flask gc`, since
+        # a duplicate upload may already reference them
+        if tmp_path and os.path.exists(tmp_path):
+            os.remove(tmp_path)
+
+
+def add_resume(tmp_path, file_hash, filename, parsed_data):
+    """
+    Store a parsed upload and add its Resume row to the session
+    
+    The temp file is moved into the blob store, unless retention drops the
+    original right away; the caller commits and removes any leftover temp file.
+    """
+    extension = filename.rsplit('.', 1)[1].lower()
+    timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+    
+    # Keep the original in the blob store unless retention drops it right away
+    if app.config['UPLOAD_RETENTION_DAYS'] == 0 and parsed_data['text']:
+        file_path = ''
+    else:
+        file_path = blob_store.put(tmp_path, file_hash, extension)
+    
+    resume = Resume(
+        filename=f"{timestamp}_{filename}",
+        original_filename=filename,
+        file_path=file_path,
+        extracted_text=parsed_data['text'],
+        candidate_name=parsed_data['name'],
+        candidate_email=parsed_data['email'],
+        candidate_phone=parsed_data['phone'],
+        skills_found=json.dumps(parsed_data['skills']),
+        experience_years=parsed_data['experience_years'],
+        education_level=parsed_data['education']
+    )
+    db.session.add(resume)
+    return resume
 
 
 @app.route('/api/resumes', methods=['GET'])
 def get_resumes():
-    """Get all resumes"""
+    """Get all resumes, or only those changed since a cursor"""
     try:
-        resumes = Resume.query.order_by(Resume.uploaded_at.desc()).all()
-        return jsonify({
+        since = parse_since()
+    except ValueError:
+        return jsonify({'error': 'Invalid since cursor'}), 400
+    
+    try:
+        etag = collection_etag(collection_state(Resume, Resume.uploaded_at))
+        cached = not_modified(etag)
+        if cached:
+            return cached
+        
+        cursor = next_cursor()
+        query = Resume.query.order_by(Resume.uploaded_at.desc())
+        if since:
+            query = query.filter(Resume.uploaded_at > since)
+        resumes = query.all()
+        
+        payload = {
             'resumes': [resume.to_dict() for resume in resumes],
-            'total': len(resumes)
-        })
+            'total': Resume.query.count() if since else len(resumes),
+            'cursor': cursor
+        }
+        if since:
+            payload['deleted'] = deleted_since(Resume, since)
+        return conditional_jsonify(etag, payload)
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
@@ -122,19 +349,37 @@ def get_resume(resume_id):
         return jsonify({'error': str(e)}), 500
 
 
+@app.route('/api/resumes/<int:resume_id>/file', methods=['GET'])
+def download_resume(resume_id):
+    """Download the original file of a resume"""
+    try:
+        resume = Resume.query.get_or_404(resume_id)
+        if not resume.file_path or not os.path.exists(resume.file_path):
+            return jsonify({'error': 'Original file is no longer stored'}), 404
+        
+        # Blobs may be stored compressed; open() hands back the original bytes
+        return send_file(blob_store.open(resume.file_path), as_attachment=True,
+                         download_name=resume.original_filename)
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+
+
 @app.route('/api/resumes/<int:resume_id>', methods=['DELETE'])
 def delete_resume(resume_id):
     """Delete resume"""
     try:
         resume = Resume.query.get_or_404(resume_id)
         
-        # Delete file
-        if os.path.exists(resume.file_path):
-            os.remove(resume.file_path)
-        
+        record_tombstones(Resume, [resume_id])
+        record_tombstones(Screening, [screening_id for (screening_id,) in
+                                      db.session.query(Screening.id).filter_by(resume_id=resume_id)])
         db.session.delete(resume)
         db.session.commit()
         
+        # The original is left to `flask gc`: a duplicate upload may be
+        # reusing the blob right now, and put() refreshes it to keep it alive
+        vector_store.delete(resume_id)
+        
         return jsonify({'message': 'Resume deleted successfully'})
     except Exception as e:
         return jsonify({'error': str(e)}), 500
@@ -169,13 +414,32 @@ def create_job():
 
 @app.route('/api/jobs', methods=['GET'])
 def get_jobs():
-    """Get all job descriptions"""
+    """Get all job descriptions, or only those changed since a cursor"""
     try:
-        jobs = JobDescription.query.order_by(JobDescription.created_at.desc()).all()
-        return jsonify({
+        since = parse_since()
+    except ValueError:
+        return jsonify({'error': 'Invalid since cursor'}), 400
+    
+    try:
+        etag = collection_etag(collection_state(JobDescription, JobDescription.updated_at))
+        cached = not_modified(etag)
+        if cached:
+            return cached
+        
+        cursor = next_cursor()
+        query = JobDescription.query.order_by(JobDescription.created_at.desc())
+        if since:
+            query = query.filter(JobDescription.updated_at > since)
+        jobs = query.all()
+        
+        payload = {
             'jobs': [job.to_dict() for job in jobs],
-            'total': len(jobs)
-        })
+            'total': JobDescription.query.count() if since else len(jobs),
+            'cursor': cursor
+        }
+        if since:
+            payload['deleted'] = deleted_since(JobDescription, since)
+        return conditional_jsonify(etag, payload)
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
@@ -195,8 +459,12 @@ def delete_job(job_id):
     """Delete job description"""
     try:
         job = JobDescription.query.get_or_404(job_id)
+        record_tombstones(JobDescription, [job_id])
+        record_tombstones(Screening, [screening_id for (screening_id,) in
+                                      db.session.query(Screening.id).filter_by(job_id=job_id)])
         db.session.delete(job)
         db.session.commit()
+        job_profiles.invalidate(job_id)
         
         return jsonify({'message': 'Job description deleted successfully'})
     except Exception as e:
@@ -218,24 +486,8 @@ def screen_resume():
         resume = Resume.query.get_or_404(resume_id)
         job = JobDescription.query.get_or_404(job_id)
         
-        # Prepare data for matching
-        resume_data = {
-            'text': resume.extracted_text,
-            'skills': json.loads(resume.skills_found) if resume.skills_found else [],
-            'experience_years': resume.experience_years or 0,
-            'education': resume.education_level or 'Not Specified'
-        }
-        
-        job_data = {
-            'description': job.description,
-            'required_skills': json.loads(job.required_skills) if job.required_skills else [],
-            'preferred_skills': json.loads(job.preferred_skills) if job.preferred_skills else [],
-            'min_experience': job.min_experience or 0,
-            'education_required': job.education_required or 'Not Specified'
-        }
-        
         # Perform screening
-        results = matcher.screen_resume(resume_data, job_data)
+        results = matcher.screen_resume_profile(resume_match_data(resume), job_profile(job))
         
         # Save screening results
         screening = Screening(
@@ -267,11 +519,129 @@ def screen_resume():
         return jsonify({'error': str(e)}), 500
 
 
+def load_ranked(ranked_ids, scores):
+    """
+    Load ranked resumes for display, without their extracted text
+    
+    Resumes deleted since ranking are dropped together with their scores.
+    Returns (resume dictionaries, position-aligned score arrays).
+    """
+    found = {resume.id: resume for resume in Resume.query.options(
+        defer(Resume.extracted_text)
+    ).filter(Resume.id.in_(ranked_ids))}
+    keep = [position for position, resume_id in enumerate(ranked_ids) if resume_id in found]
+    return (
+        [found[ranked_ids[position]].to_dict() for position in keep],
+        {field: np.asarray(values, dtype=np.float64)[keep] for field, values in scores.items()}
+    )
+
+
+@app.route('/api/rank', methods=['POST'])
+def rank_resumes():
+    """Rank resumes against a job description without saving screenings"""
+    try:
+        data = request.get_json()
+        job_id = data.get('job_id')
+        
+        if not job_id:
+            return jsonify({'error': 'Job ID is required'}), 400
+        
+        job = JobDescription.query.get_or_404(job_id)
+        # An empty list means no filter, as it always has for the full ranking
+        resume_ids = data.get('resume_ids') or None
+        
+        failed_shards = None
+        if shard_coordinator is not None:
+            # Each shard ranks its own partition; merge and load the winners
+            result = shard_coordinator.rank(
+                job.id, job.updated_at, job_match_data(job),
+                k=int(data['limit']) if data.get('limit') else None,
+                resume_ids=resume_ids
+            )
+            ranked_resumes, scores = load_ranked(
+                [row[0] for row in result['rankings']],
+                {field: [row[column] for row in result['rankings']] for column, field in enumerate(RANK_FIELDS, start=1)}
+            )
+            total = result['total']
+            failed_shards = result['failed_shards']
+        elif data.get('limit'):
+            # Rank from the shared vector store; only the candidates that
+            # can reach the top have their text loaded
+            candidate_table.refresh()
+            candidates = candidate_table.snapshot(resume_ids)
+            result = matcher.rank_candidates(
+                candidates,
+                job_profile(job),
+                int(data['limit']),
+                load_texts=CandidateTable.text_loader(candidates)
+            )
+            ranked_resumes, scores = load_ranked(
+                [int(candidates['ids'][index]) for index in result['indices']],
+                {field: result[field] for field in RANK_FIELDS}
+            )
+            total = len(candidates['ids'])
+        else:
+            query = Resume.query
+            if resume_ids:
+                query = query.filter(Resume.id.in_(resume_ids))
+            resumes = query.all()
+            
+            # Score all resumes in one batch, sharded across worker processes
+            scores = executor.score_profiles(
+                [resume_match_data(resume) for resume in resumes],
+                [job_profile(job)]
+            )
+            order = np.argsort(-scores['overall_score'][:, 0], kind='stable')
+            scores = {key: values[order, 0] for key, values in scores.items()}
+            ranked_resumes = [resumes[index].to_dict() for index in order]
+            total = len(resumes)
+        
+        rankings = []
+        for position, resume in enumerate(ranked_resumes):
+            overall_score = float(scores['overall_score'][position])
+            rankings.append({
+                'rank': position + 1,
+                'resume': resume,
+                'overall_score': round(overall_score, 2),
+                'skill_match_score': round(float(scores['skill_match_score'][position]), 2),
+                'experience_score': round(float(scores['experience_score'][position]), 2),
+                'education_score': round(float(scores['education_score'][position]), 2),
+                'text_similarity_score': round(float(scores['text_similarity_score'][position]), 2),
+                'recommendation': matcher.generate_recommendation(overall_score)
+            })
+        
+        response = {
+            'job': job.to_dict(),
+            'rankings': rankings,
+            'total': total
+        }
+        if failed_shards is not None:
+            response['failed_shards'] = {str(shard): error for shard, error in failed_shards.items()}
+        return jsonify(response)
+        
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+
+
 @app.route('/api/screenings', methods=['GET'])
 def get_screenings():
-    """Get all screening results"""
+    """Get all screening results, or only those added since a cursor"""
     try:
-        screenings = Screening.query.order_by(Screening.screened_at.desc()).all()
+        since = parse_since()
+    except ValueError:
+        return jsonify({'error': 'Invalid since cursor'}), 400
+    
+    try:
+        etag = collection_etag(collection_state(Screening, Screening.screened_at))
+        cached = not_modified(etag)
+        if cached:
+            return cached
+        
+        cursor = next_cursor()
+        query = Screening.query.order_by(Screening.screened_at.desc())
+        if since:
+            query = query.filter(Screening.screened_at > since)
+        screenings = query.all()
         
         results = []
         for screening in screenings:
@@ -280,10 +650,76 @@ def get_screenings():
             result['job'] = screening.job.to_dict()
             results.append(result)
         
-        return jsonify({
+        payload = {
             'screenings': results,
-            'total': len(results)
-        })
+            'total': Screening.query.count() if since else len(results),
+            'cursor': cursor
+        }
+        if since:
+            payload['deleted'] = deleted_since(Screening, since)
+        return conditional_jsonify(etag, payload)
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+
+
+def screening_export_partitions(after_id=0, chunk_size=1000):
+    """
+    Yield screening rows joined to their resume and job, chunk_size at a time
+    
+    Rows are read in id order through a server-side cursor (yield_per), so
+    the export can be resumed from the last id a client received.
+    """
+    query = db.select(
+        Screening.id,
+        Screening.resume_id,
+        Screening.job_id,
+        Resume.candidate_name,
+        Resume.candidate_email,
+        Resume.original_filename.label('resume_filename'),
+        JobDescription.title.label('job_title'),
+        Screening.overall_score,
+        Screening.skill_match_score,
+        Screening.experience_score,
+        Screening.education_score,
+        Screening.text_similarity_score,
+        Screening.recommendation,
+        Screening.matched_skills,
+        Screening.missing_skills,
+        Screening.notes,
+        Screening.screened_at
+    ).join(Resume, Screening.resume_id == Resume.id).join(
+        JobDescription, Screening.job_id == JobDescription.id
+    ).where(Screening.id > after_id).order_by(Screening.id)
+    
+    result = db.session.execute(query.execution_options(yield_per=chunk_size))
+    try:
+        yield from result.mappings().partitions()
+    finally:
+        result.close()
+
+
+@app.route('/api/screenings/export', methods=['GET'])
+def export_screenings():
+    """Stream all screening results as CSV or NDJSON"""
+    try:
+        export_format = request.args.get('format', 'csv')
+        after_id = request.args.get('after_id', 0, type=int)
+        chunk_size = min(max(request.args.get('chunk_size', 1000, type=int), 1), 10000)
+        
+        if export_format not in EXPORT_FORMATS:
+            return jsonify({'error': 'Format must be csv or ndjson'}), 400
+        
+        chunks = export_chunks(
+            screening_export_partitions(after_id, chunk_size),
+            export_format,
+            include_header=after_id == 0
+        )
+        
+        return Response(
+            stream_with_context(chunks),
+            mimetype=EXPORT_FORMATS[export_format],
+            headers={'Content-Disposition': f'attachment; filename=screenings.{export_format}'}
+        )
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
@@ -307,6 +743,15 @@ def get_screening(screening_id):
 def get_analytics():
     """Get analytics data"""
     try:
+        etag = collection_etag(
+            collection_state(Resume, Resume.uploaded_at),
+            collection_state(JobDescription, JobDescription.updated_at),
+            collection_state(Screening, Screening.screened_at)
+        )
+        cached = not_modified(etag)
+        if cached:
+            return cached
+        
         total_resumes = Resume.query.count()
         total_jobs = JobDescription.query.count()
         total_screenings = Screening.query.count()
@@ -321,7 +766,7 @@ def get_analytics():
             db.func.count(Screening.id)
         ).group_by(Screening.recommendation).all()
         
-        return jsonify({
+        return conditional_jsonify(etag, {
             'total_resumes': total_resumes,
             'total_jobs': total_jobs,
             'total_screenings': total_screenings,
@@ -333,9 +778,150 @@ def get_analytics():
         return jsonify({'error': str(e)}), 500
 
 
+@app.cli.command('export-screenings')
+@click.option('--format', 'export_format', type=click.Choice(sorted(EXPORT_FORMATS)), default='csv', show_default=True)
+@click.option('--output', type=click.Path(dir_okay=False), required=True, help='File to write')
+@click.option('--after-id', default=0, show_default=True, help='Resume after this screening id (appends to output)')
+@click.option('--chunk-size', default=1000, show_default=True, help='Rows fetched per database round trip')
+def export_screenings_command(export_format, output, after_id, chunk_size):
+    """Export screening results to CSV or NDJSON with constant memory"""
+    with open(output, 'a' if after_id else 'w', encoding='utf-8', newline='') as f:
+        for chunk in export_chunks(screening_export_partitions(after_id, chunk_size), export_format,
+                                   include_header=after_id == 0):
+            f.write(chunk)
+    print(f"✅ Exported screenings to {output}")
+
+
+@app.cli.command('import-resumes')
+@click.argument('directory', type=click.Path(exists=True, file_okay=False))
+@click.option('--batch-size', default=100, show_default=True, help='Files parsed per process pool batch')
+def import_resumes(directory, batch_size):
+    """Bulk-import PDF/DOCX resumes, parsing them across SCREENING_WORKERS processes"""
+    paths = sorted(
+        os.path.join(root, name)
+        for root, _, names in os.walk(directory)
+        for name in names
+        if allowed_file(name)
+    )
+    imported = rejected = 0
+    
+    for start in range(0, len(paths), batch_size):
+        uploads = []
+        try:
+            # Validate and hash every file exactly as an upload would be
+            for path in paths[start:start + batch_size]:
+                filename = secure_filename(os.path.basename(path))
+                try:
+                    with open(path, 'rb') as f:
+                        tmp_path, file_hash, _ = stream_upload(
+                            f,
+                            app.config['UPLOAD_FOLDER'],
+                            expected_type=filename.rsplit('.', 1)[1].lower(),
+                            max_bytes=app.config['MAX_RESUME_SIZE'],
+                            chunk_size=app.config['UPLOAD_CHUNK_SIZE']
+                        )
+                except UploadRejected as e:
+                    rejected += 1
+                    print(f"⚠️  Skipped {path}: {e.message}")
+                    continue
+                uploads.append((tmp_path, file_hash, filename))
+            
+            parsed = executor.parse_resumes([tmp_path for tmp_path, _, _ in uploads], Config.COMMON_SKILLS)
+            resumes = [
+                (add_resume(tmp_path, file_hash, filename, parsed_data), parsed_data)
+                for (tmp_path, file_hash, filename), parsed_data in zip(uploads, parsed)
+            ]
+            db.session.commit()
+            
+            for resume, parsed_data in resumes:
+                vector_store.append(resume.id, resume_feature_vector(parsed_data, Config.COMMON_SKILLS))
+            imported += len(resumes)
+        finally:
+            for tmp_path, _, _ in uploads:
+                if os.path.exists(tmp_path):
+                    os.remove(tmp_path)
+    
+    print(f"✅ Imported {imported} resumes, skipped {rejected}")
+
+
+@app.cli.command('compact-vectors')
+def compact_vectors():
+    """Drop deleted rows from the resume vector store"""
+    removed = vector_store.compact()
+    print(f"✅ Removed {removed} deleted vectors, {vector_store.live_count()} remaining")
+
+
+@app.cli.command('gc')
+@click.option('--dry-run', is_flag=True, help='Report what would be removed without deleting')
+@click.option('--min-age', default=3600, show_default=True,
+              help='Only collect unreferenced files older than this many seconds')
+def collect_garbage(dry_run, min_age):
+    """Remove unreferenced uploads and originals past the retention period"""
+    removed = 0
+    
+    referenced = {os.path.abspath(path) for (path,) in db.session.query(Resume.file_path).distinct() if path}
+    
+    # Stale temp files from interrupted uploads, and pre-blob-store uploads
+    # saved flat in the upload folder whose resumes have been deleted
+    cutoff = time.time() - min_age
+    with os.scandir(app.config['UPLOAD_FOLDER']) as entries:
+        for entry in entries:
+            if not entry.is_file() or entry.name.startswith('.') or entry.stat().st_mtime >= cutoff:
+                continue
+            if entry.name.startswith(TEMP_PREFIX) or os.path.abspath(entry.path) not in referenced:
+                removed += 1
+                if not dry_run:
+                    os.remove(entry.path)
+    
+    # Blobs no resume references, from deleted resumes or failed commits
+    for path in blob_store.iter_blobs(min_age=min_age):
+        if os.path.abspath(path) not in referenced:
+            removed += 1
+            if not dry_run:
+                blob_store.remove(path)
+    
+    # Originals whose text has been extracted and whose resumes are all
+    # older than the retention period
+    retention_days = app.config['UPLOAD_RETENTION_DAYS']
+    expired = 0
+    if retention_days is not None:
+        retention_cutoff = datetime.utcnow() - timedelta(days=retention_days)
+        has_text = db.and_(Resume.extracted_text.isnot(None), Resume.extracted_text != '')
+        keep = {path for (path,) in db.session.query(Resume.file_path).filter(
+            db.or_(Resume.uploaded_at >= retention_cutoff, db.not_(has_text))
+        ).distinct()}
+        candidates = {path for (path,) in db.session.query(Resume.file_path).filter(
+            Resume.uploaded_at < retention_cutoff, has_text, Resume.file_path != ''
+        ).distinct()}
+        
+        for path in candidates - keep:
+            if os.path.exists(path) and os.path.getmtime(path) >= cutoff:
+                continue  # Just reused by a duplicate upload
+            expired += 1
+            if not dry_run:
+                blob_store.remove(path)
+                Resume.query.filter_by(file_path=path).update({'file_path': ''})
+        if not dry_run:
+            db.session.commit()
+    
+    action = 'Would remove' if dry_run else 'Removed'
+    print(f"✅ {action} {removed} unreferenced files and {expired} expired originals")
+    
+    # Deletes only tombstone vectors; rewrite the store once enough are dead
+    if vector_store.needs_compaction():
+        if dry_run:
+            print("✅ Would compact the vector store")
+        else:
+            compacted = vector_store.compact()
+            print(f"✅ Compacted {compacted} deleted vectors from the vector store")
+
+
 # Initialize database
 with app.app_context():
     db.create_all()
+    added, removed = candidate_table.load()
+    if added or removed:
+        print(f"✅ Vector store synced: {added} added, {removed} removed")
     print("✅ Database initialized successfully")
 
 
@@ -0,0 +1,196 @@
+"""
+ASGI serving mode for the Flask application
+
+Run with:
+    uvicorn asgi:application --host 0.0.0.0 --port 8000
+
+Request bodies are received and response bodies are sent on the event loop,
+so slow clients never hold a thread. Only the Flask view itself (parsing,
+matching, database work) runs in a bounded thread pool.
+"""
+import asyncio
+import contextvars
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from tempfile import SpooledTemporaryFile
+
+from app import app
+
+SPOOL_MAX_SIZE = 1024 * 1024  # Bodies above 1MB spill to a temp file
+
+
+class FlaskASGIAdapter:
+    """Serve a WSGI application over ASGI, running only the view code off-loop"""
+
+    def __init__(self, wsgi_app, max_threads: int, max_body_size: int):
+        self.wsgi_app = wsgi_app
+        self.max_body_size = max_body_size
+        self.thread_pool = ThreadPoolExecutor(max_workers=max_threads, thread_name_prefix='asgi-view')
+
+    async def __call__(self, scope, receive, send):
+        if scope['type'] == 'lifespan':
+            await self._lifespan(receive, send)
+        elif scope['type'] == 'http':
+            await self._http(scope, receive, send)
+        else:
+            raise ValueError(f"Unsupported ASGI scope type '{scope['type']}'")
+
+    async def _lifespan(self, receive, send):
+        while True:
+            message = await receive()
+            if message['type'] == 'lifespan.startup':
+                await send({'type': 'lifespan.startup.complete'})
+            elif message['type'] == 'lifespan.shutdown':
+                self.thread_pool.shutdown(wait=False)
+                await send({'type': 'lifespan.shutdown.complete'})
+                return
+
+    async def _http(self, scope, receive, send):
+        loop = asyncio.get_running_loop()
+        with SpooledTemporaryFile(max_size=SPOOL_MAX_SIZE) as body:
+            # Receive the whole body on the loop before a view thread is involved
+            size = 0
+            while True:
+                message = await receive()
+                if message['type'] == 'http.disconnect':
+                    return
+                chunk = message.get('body', b'')
+                size += len(chunk)
+                if size > self.max_body_size:
+                    await self._send_simple(send, 413, b'{"error": "File too large"}')
+                    return
+                if size > SPOOL_MAX_SIZE:
+                    # The body has spilled to disk, keep file writes off the loop
+                    await loop.run_in_executor(None, body.write, chunk)
+                else:
+                    body.write(chunk)
+                if not message.get('more_body'):
+                    break
+            body.seek(0)
+
+            response = {}
+            # Each pool call may land on a different thread; running them all
+            # in one context keeps Flask's request context across chunks
+            context = contextvars.copy_context()
+
+            def start_response(status, headers, exc_info=None):
+                response['status'] = int(status.split(' ', 1)[0])
+                response['headers'] = [
+                    (name.lower().encode('latin1'), value.encode('latin1')) for name, value in headers
+                ]
+
+            def run_view():
+                iterable = self.wsgi_app(self._environ(scope, body, size), start_response)
+                if any(name == b'content-length' for name, _ in response['headers']):
+                    # Fixed-length bodies are already in memory, drain them in one hop
+                    try:
+                        return b''.join(iterable), None
+                    finally:
+                        if hasattr(iterable, 'close'):
+                            iterable.close()
+                return None, iterable
+
+            payload, iterable = await loop.run_in_executor(self.thread_pool, context.run, run_view)
+            await send({
+                'type': 'http.response.start',
+                'status': response['status'],
+                'headers': response['headers']
+            })
+            if iterable is None:
+                await send({'type': 'http.response.body', 'body': payload})
+                return
+
+            # Streaming responses produce each chunk in the pool and are
+            # written to the socket from the loop. A client that goes away
+            # stops the stream instead of leaving the view generating chunks
+            chunks = iter(iterable)
+            disconnect = asyncio.ensure_future(self._wait_for_disconnect(receive))
+            pending = None
+            try:
+                while True:
+                    pending = loop.run_in_executor(self.thread_pool, context.run, next, chunks, None)
+                    await asyncio.wait({pending, disconnect}, return_when=asyncio.FIRST_COMPLETED)
+                    if not pending.done():
+                        break
+                    chunk, pending = pending.result(), None
+                    if chunk is None:
+                        await send({'type': 'http.response.body'})
+                        break
+                    if chunk:
+                        await send({'type': 'http.response.body', 'body': chunk, 'more_body': True})
+            finally:
+                disconnect.cancel()
+                if pending is not None:
+                    # The generator cannot be closed while next() is still running
+                    await asyncio.wait({pending})
+                if hasattr(iterable, 'close'):
+                    await loop.run_in_executor(self.thread_pool, context.run, iterable.close)
+
+    @staticmethod
+    async def _wait_for_disconnect(receive):
+        """Return once the client has disconnected"""
+        while True:
+            message = await receive()
+            if message['type'] == 'http.disconnect':
+                return
+
+    @staticmethod
+    async def _send_simple(send, status, payload):
+        await send({
+            'type': 'http.response.start',
+            'status': status,
+            'headers': [(b'content-type', b'application/json'),
+                        (b'content-length', str(len(payload)).encode())]
+        })
+        await send({'type': 'http.response.body', 'body': payload})
+
+    @staticmethod
+    def _environ(scope, body, size):
+        """
+        Translate an ASGI HTTP scope into a WSGI environ
+
+        The body is fully buffered, so its size is known even for chunked
+        requests and replaces any Content-Length header.
+        """
+        script_name = scope.get('root_path', '')
+        path_info = scope['path']
+        if path_info.startswith(script_name):
+            path_info = path_info[len(script_name):]
+
+        server = scope.get('server') or ('localhost', 80)
+        environ = {
+            'REQUEST_METHOD': scope['method'],
+            'SCRIPT_NAME': script_name.encode('utf8').decode('latin1'),
+            'PATH_INFO': path_info.encode('utf8').decode('latin1'),
+            'QUERY_STRING': scope['query_string'].decode('latin1'),
+            'SERVER_NAME': server[0],
+            'SERVER_PORT': str(server[1]),
+            'SERVER_PROTOCOL': f"HTTP/{scope['http_version']}",
+            'wsgi.version': (1, 0),
+            'wsgi.url_scheme': scope.get('scheme', 'http'),
+            'wsgi.input': body,
+            'wsgi.input_terminated': True,
+            'wsgi.errors': sys.stderr,
+            'wsgi.multithread': True,
+            'wsgi.multiprocess': True,
+            'wsgi.run_once': False
+        }
+        if scope.get('client'):
+            environ['REMOTE_ADDR'] = scope['client'][0]
+
+        for name, value in scope.get('headers', []):
+            name = name.decode('latin1').upper().replace('-', '_')
+            value = value.decode('latin1')
+            if name not in ('CONTENT_LENGTH', 'CONTENT_TYPE'):
+                name = f'HTTP_{name}'
+            environ[name] = f"{environ[name]},{value}" if name in environ else value
+        environ['CONTENT_LENGTH'] = str(size)
+        environ.pop('HTTP_TRANSFER_ENCODING', None)
+        return environ
+
+
+application = FlaskASGIAdapter(
+    app,
+    max_threads=app.config['ASGI_THREADS'],
+    max_body_size=app.config['MAX_CONTENT_LENGTH']
+)
@@ -0,0 +1,111 @@
+"""
+Compare memory and ranking time of Resume ORM objects and the CandidateTable
+
+Usage:
+    python benchmarks/bench_candidate_table.py [--resumes 50000] [--k 20]
+
+A temporary SQLite database is filled with synthetic resumes. ORM memory is
+measured with tracemalloc while the objects are held in memory. The
+CandidateTable footprint is the vector store file, which all processes share
+through the page cache, plus the per-query copies each ranking call makes;
+both are reported, along with their sum.
+"""
+import argparse
+import json
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+# Must be set before config is imported
+DB_DIR = tempfile.mkdtemp(prefix='bench-candidates-')
+os.environ['DATABASE_URL'] = 'sqlite:///' + os.path.join(DB_DIR, 'bench.db')
+
+from bench_score_matrix import make_data
+from models import db, Resume
+from config import Config
+from shard_worker import create_app
+from utils.candidate_table import CandidateTable
+from utils.ml_matcher import ResumeJobMatcher
+from utils.vector_store import ResumeVectorStore, FEATURE_SKILLS
+
+
+def measure(load):
+    """Return (result, bytes allocated and still held, seconds)"""
+    tracemalloc.start()
+    start = time.perf_counter()
+    result = load()
+    elapsed = time.perf_counter() - start
+    held, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return result, held, elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--resumes', type=int, default=50000)
+    parser.add_argument('--k', type=int, default=20)
+    args = parser.parse_args()
+
+    app = create_app()
+    resumes, jobs = make_data(args.resumes, 1)
+    matcher = ResumeJobMatcher()
+    profile = matcher.compile_job(jobs[0])
+
+    with app.app_context():
+        db.create_all()
+        db.session.bulk_insert_mappings(Resume, [{
+            'filename': f'resume{i}.pdf',
+            'original_filename': f'resume{i}.pdf',
+            'file_path': '',
+            'extracted_text': resume['text'],
+            'candidate_name': f'Candidate {i}',
+            'candidate_email': f'candidate{i}@example.com',
+            'skills_found': json.dumps(resume['skills']),
+            'experience_years': resume['experience_years'],
+            'education_level': resume['education']
+        } for i, resume in enumerate(resumes)])
+        db.session.commit()
+
+        rows, orm_bytes, orm_load = measure(lambda: Resume.query.order_by(Resume.id).all())
+        start = time.perf_counter()
+        orm_result = matcher.rank_top_k([{
+            'text': row.extracted_text,
+            'skills': json.loads(row.skills_found) if row.skills_found else [],
+            'experience_years': row.experience_years or 0,
+            'education': row.education_level or 'Not Specified'
+        } for row in rows], profile, args.k)
+        orm_rank = time.perf_counter() - start
+        orm_ids = [rows[index].id for index in orm_result['indices']]
+        del rows
+        db.session.expunge_all()
+
+        store_path = os.path.join(DB_DIR, 'vectors.bin')
+        store = ResumeVectorStore(store_path, dim=FEATURE_SKILLS + len(Config.COMMON_SKILLS))
+        table = CandidateTable(store, Config.COMMON_SKILLS)
+        _, _, table_load = measure(table.load)
+        start = time.perf_counter()
+        candidates, table_bytes, _ = measure(table.snapshot)
+        table_result = matcher.rank_candidates(candidates, profile, args.k, CandidateTable.text_loader(candidates))
+        table_rank = time.perf_counter() - start
+        table_ids = [int(candidates['ids'][index]) for index in table_result['indices']]
+
+    n = args.resumes
+    footprint = store.footprint()
+    store_bytes = footprint['allocated_bytes']
+    print(f"{n} resumes, top {args.k}")
+    print(f"ORM objects      {orm_bytes / n:8.0f} bytes/candidate   load {orm_load:6.2f}s   rank {orm_rank:6.2f}s")
+    print(f"CandidateTable   {(store_bytes + table_bytes) / n:8.0f} bytes/candidate   "
+          f"load {table_load:6.2f}s   rank {table_rank:6.2f}s")
+    print(f"  store file     {store_bytes / n:8.0f} bytes/candidate on disk "
+          f"({footprint['row_bytes']} per row, shared by all processes)")
+    print(f"  query copies   {table_bytes / n:8.0f} bytes/candidate per ranking call")
+    print(f"same top-{args.k}: {orm_ids == table_ids}")
+
+
+if __name__ == '__main__':
+    main()
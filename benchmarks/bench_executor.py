@@ -0,0 +1,61 @@
+"""
+Benchmark ScreeningExecutor scaling across worker counts
+
+Usage:
+    python benchmarks/bench_executor.py [--resumes 20000] [--jobs 200] [--workers 1 2 4 8]
+
+Each run scores the same synthetic batch; speedup and parallel efficiency are
+reported relative to the single-worker run.
+"""
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from bench_score_matrix import make_data
+from utils.executor import ScreeningExecutor, SCORE_KEYS
+from utils.ml_matcher import ResumeJobMatcher
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--resumes', type=int, default=20000)
+    parser.add_argument('--jobs', type=int, default=200)
+    parser.add_argument('--workers', type=int, nargs='+', default=[1, 2, 4, 8])
+    parser.add_argument('--chunk-size', type=int, default=500)
+    args = parser.parse_args()
+    
+    resumes, jobs = make_data(args.resumes, args.jobs)
+    matcher = ResumeJobMatcher()
+    print(f"{args.resumes} resumes x {args.jobs} jobs, chunk size {args.chunk_size}, "
+          f"{os.cpu_count()} CPUs available")
+    
+    baseline = None
+    reference = None
+    for workers in args.workers:
+        executor = ScreeningExecutor(matcher, workers=workers, chunk_size=args.chunk_size)
+        executor.start()  # Pool start-up is paid once per process, not per batch
+        try:
+            start = time.perf_counter()
+            scores = executor.score_matrix(resumes, jobs)
+            seconds = time.perf_counter() - start
+        finally:
+            executor.close()
+        
+        if baseline is None:
+            baseline = seconds
+            reference = scores
+        for key in SCORE_KEYS:
+            assert np.array_equal(scores[key], reference[key]), f"{key} differs with {workers} workers"
+        
+        speedup = baseline / seconds
+        print(f"workers={workers:<3} {seconds:7.2f}s  speedup {speedup:5.2f}x  "
+              f"efficiency {speedup / workers:6.1%}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,91 @@
+"""
+Benchmark ResumeJobMatcher.score_matrix against per-pair screen_resume
+
+Usage:
+    python benchmarks/bench_score_matrix.py [--resumes 10000] [--jobs 500]
+
+The per-pair baseline is timed on a sample of pairs and extrapolated to the
+full grid; the same sample is used to check that both paths agree.
+"""
+import argparse
+import os
+import random
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from config import Config
+from utils.ml_matcher import ResumeJobMatcher
+
+SCORE_KEYS = ['overall_score', 'skill_match_score', 'text_similarity_score',
+              'experience_score', 'education_score']
+EDUCATION_LEVELS = ['High School', 'Diploma', 'Bachelors', 'Masters', 'Phd', 'Not Specified']
+
+
+def make_text(rng, vocabulary, length):
+    return ' '.join(rng.choice(vocabulary) for _ in range(length))
+
+
+def make_data(num_resumes, num_jobs, seed=42):
+    """Generate synthetic resumes and jobs in the dict format used by screen_resume"""
+    rng = random.Random(seed)
+    vocabulary = [f'term{i}' for i in range(5000)] + Config.COMMON_SKILLS
+    
+    resumes = [{
+        'text': make_text(rng, vocabulary, rng.randint(80, 200)),
+        'skills': rng.sample(Config.COMMON_SKILLS, rng.randint(3, 15)),
+        'experience_years': float(rng.randint(0, 15)),
+        'education': rng.choice(EDUCATION_LEVELS)
+    } for _ in range(num_resumes)]
+    
+    jobs = [{
+        'description': make_text(rng, vocabulary, rng.randint(40, 120)),
+        'required_skills': rng.sample(Config.COMMON_SKILLS, rng.randint(2, 8)),
+        'preferred_skills': rng.sample(Config.COMMON_SKILLS, rng.randint(0, 5)),
+        'min_experience': float(rng.randint(0, 8)),
+        'education_required': rng.choice(EDUCATION_LEVELS)
+    } for _ in range(num_jobs)]
+    
+    return resumes, jobs
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--resumes', type=int, default=10000)
+    parser.add_argument('--jobs', type=int, default=500)
+    parser.add_argument('--sample', type=int, default=2000, help='pairs timed with screen_resume')
+    args = parser.parse_args()
+    
+    resumes, jobs = make_data(args.resumes, args.jobs)
+    matcher = ResumeJobMatcher()
+    
+    start = time.perf_counter()
+    scores = matcher.score_matrix(resumes, jobs)
+    matrix_seconds = time.perf_counter() - start
+    
+    rng = random.Random(0)
+    pairs = [(rng.randrange(args.resumes), rng.randrange(args.jobs)) for _ in range(args.sample)]
+    max_error = 0.0
+    start = time.perf_counter()
+    for i, j in pairs:
+        result = matcher.screen_resume(resumes[i], jobs[j])
+        for key in SCORE_KEYS:
+            max_error = max(max_error, abs(result[key] - scores[key][i, j]))
+    pair_seconds = (time.perf_counter() - start) / args.sample
+    
+    total_pairs = args.resumes * args.jobs
+    print(f"Grid:               {args.resumes} resumes x {args.jobs} jobs ({total_pairs:,} pairs)")
+    print(f"score_matrix:       {matrix_seconds:.2f}s ({total_pairs / matrix_seconds:,.0f} pairs/s)")
+    print(f"screen_resume:      {pair_seconds * 1e3:.3f} ms/pair, ~{pair_seconds * total_pairs:,.0f}s extrapolated")
+    print(f"Speedup:            ~{pair_seconds * total_pairs / matrix_seconds:,.0f}x")
+    print(f"Max abs difference: {max_error:.2e} over {args.sample} sampled pairs")
+    
+    if not np.isfinite(max_error) or max_error > 1e-6:
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,108 @@
+"""
+Benchmark sharded ranking with 1 to N local shard workers
+
+Usage:
+    python benchmarks/bench_shards.py [--resumes 50000] [--max-shards 4] [--jobs 5] [--k 20]
+
+A temporary SQLite database is filled with synthetic resumes; for each shard
+count a local cluster is started with shard_worker.start_local_shards and the
+same rank requests are sent through a ShardCoordinator. Every merged top-K
+is checked against single-process ranking.
+"""
+import argparse
+import json
+import os
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+# Must be set before config is imported
+DB_DIR = tempfile.mkdtemp(prefix='bench-shards-')
+os.environ['DATABASE_URL'] = 'sqlite:///' + os.path.join(DB_DIR, 'bench.db')
+os.environ['VECTOR_STORE_PATH'] = os.path.join(DB_DIR, 'vectors.bin')
+os.environ['SHARD_AUTHKEY'] = 'bench-shards'
+
+from bench_score_matrix import make_data
+from models import db, Resume
+from shard_worker import create_app, start_local_shards
+from utils.ml_matcher import ResumeJobMatcher
+from utils.shards import ShardCoordinator
+
+AUTHKEY = os.environ['SHARD_AUTHKEY'].encode()
+
+
+def populate(app, resumes):
+    with app.app_context():
+        db.create_all()
+        db.session.bulk_insert_mappings(Resume, [{
+            'filename': f'resume{i}.pdf',
+            'original_filename': f'resume{i}.pdf',
+            'file_path': '',
+            'extracted_text': resume['text'],
+            'skills_found': json.dumps(resume['skills']),
+            'experience_years': resume['experience_years'],
+            'education_level': resume['education']
+        } for i, resume in enumerate(resumes)])
+        db.session.commit()
+
+
+def wait_ready(coordinator, timeout=120):
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        results, errors = coordinator.ping()
+        if not errors:
+            return
+        time.sleep(0.2)
+    raise RuntimeError(f'shards not ready: {errors}')
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--resumes', type=int, default=50000)
+    parser.add_argument('--max-shards', type=int, default=4)
+    parser.add_argument('--jobs', type=int, default=5)
+    parser.add_argument('--k', type=int, default=20)
+    parser.add_argument('--port', type=int, default=7100, help='first shard port')
+    args = parser.parse_args()
+
+    app = create_app()
+    resumes, jobs = make_data(args.resumes, args.jobs)
+    populate(app, resumes)
+
+    # Single-process reference; database ids follow insertion order
+    matcher = ResumeJobMatcher()
+    expected = [
+        [int(index) + 1 for index in matcher.rank_top_k(resumes, matcher.compile_job(job), args.k)['indices']]
+        for job in jobs
+    ]
+
+    print(f"{args.resumes} resumes, {args.jobs} jobs, top {args.k}")
+    baseline = None
+    for num_shards in range(1, args.max_shards + 1):
+        processes, addresses = start_local_shards(num_shards, base_port=args.port)
+        coordinator = ShardCoordinator(addresses, authkey=AUTHKEY, timeout=300)
+        try:
+            wait_ready(coordinator)
+            mismatches = 0
+            start = time.perf_counter()
+            for revision, (job, expected_ids) in enumerate(zip(jobs, expected)):
+                result = coordinator.rank(revision, revision, job, k=args.k)
+                mismatches += [row[0] for row in result['rankings']] != expected_ids
+            elapsed = (time.perf_counter() - start) / args.jobs
+        finally:
+            coordinator.close()
+            for process in processes:
+                process.terminate()
+                process.join()
+
+        baseline = baseline or elapsed
+        print(f"{num_shards} shard(s)  {elapsed * 1000:9.1f} ms/rank   "
+              f"speedup {baseline / elapsed:4.2f}x   mismatches {mismatches}")
+        args.port += num_shards
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,57 @@
+"""
+Benchmark bound-based top-K ranking against exhaustive scoring
+
+Usage:
+    python benchmarks/bench_top_k.py [--resumes 20000] [--jobs 10] [--k 20]
+
+Each job is ranked both ways; the top-K indices must be identical.
+"""
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from bench_score_matrix import make_data
+from utils.ml_matcher import ResumeJobMatcher
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--resumes', type=int, default=20000)
+    parser.add_argument('--jobs', type=int, default=10)
+    parser.add_argument('--k', type=int, default=20)
+    args = parser.parse_args()
+
+    matcher = ResumeJobMatcher()
+    resumes, jobs = make_data(args.resumes, args.jobs)
+
+    exhaustive_time = top_k_time = 0.0
+    text_scored = 0
+    mismatches = 0
+    for job in jobs:
+        start = time.perf_counter()
+        scores = matcher.score_matrix(resumes, [job])
+        expected = np.argsort(-scores['overall_score'][:, 0], kind='stable')[:args.k]
+        exhaustive_time += time.perf_counter() - start
+
+        start = time.perf_counter()
+        result = matcher.rank_top_k(resumes, matcher.compile_job(job), args.k)
+        top_k_time += time.perf_counter() - start
+
+        text_scored += result['text_scored']
+        mismatches += not np.array_equal(result['indices'], expected)
+
+    print(f"{args.resumes} resumes, {args.jobs} jobs, top {args.k}")
+    print(f"exhaustive  {exhaustive_time / args.jobs * 1000:9.1f} ms/job")
+    print(f"top-k       {top_k_time / args.jobs * 1000:9.1f} ms/job   "
+          f"speedup {exhaustive_time / top_k_time:5.1f}x")
+    print(f"text similarity computed for {text_scored / (args.resumes * args.jobs):.1%} of resumes")
+    print(f"mismatched rankings: {mismatches}")
+
+
+if __name__ == '__main__':
+    main()
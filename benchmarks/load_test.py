@@ -0,0 +1,235 @@
+"""
+Load test comparing the Flask development server with the ASGI serving mode
+
+Usage:
+    python benchmarks/load_test.py [--clients 200] [--duration 30]
+    python benchmarks/load_test.py --url http://localhost:8000 --clients 200
+
+Without --url both servers are started locally (Flask threaded server and
+uvicorn asgi:application), each against a fresh database, upload folder and
+vector store in a temporary directory, and tested one after the other with
+the same request mix. Each client holds one keep-alive
+connection, reconnecting whenever the server closes it.
+
+The mix adds resume uploads and top-K ranking to the dashboard reads, so a
+run against --url leaves extra resumes and a "Load test" job in that
+server's database.
+"""
+import argparse
+import asyncio
+import json
+import os
+import shutil
+import socket
+import subprocess
+import sys
+import tempfile
+import time
+import urllib.error
+import urllib.request
+from urllib.parse import urlsplit
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Dashboard refresh reads, plus the write and CPU-heavy endpoints
+READ_PATHS = ['/api/health', '/api/resumes', '/api/jobs', '/api/screenings', '/api/analytics']
+BOUNDARY = 'load-test-boundary'
+
+
+def minimal_pdf(text):
+    """A one-page PDF showing text, with a correct cross-reference table"""
+    stream = f'BT /F1 12 Tf 72 720 Td ({text}) Tj ET'.encode('latin1')
+    objects = [
+        b'<< /Type /Catalog /Pages 2 0 R >>',
+        b'<< /Type /Pages /Kids [3 0 R] /Count 1 >>',
+        b'<< /Type /Page /Parent 2 0 R /MediaBox [0 0 612 792] '
+        b'/Resources << /Font << /F1 5 0 R >> >> /Contents 4 0 R >>',
+        b'<< /Length %d >>\nstream\n%s\nendstream' % (len(stream), stream),
+        b'<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>'
+    ]
+    pdf = bytearray(b'%PDF-1.4\n')
+    offsets = []
+    for number, body in enumerate(objects, start=1):
+        offsets.append(len(pdf))
+        pdf += b'%d 0 obj\n%s\nendobj\n' % (number, body)
+    xref = len(pdf)
+    pdf += b'xref\n0 %d\n0000000000 65535 f \n' % (len(objects) + 1)
+    pdf += b''.join(b'%010d 00000 n \n' % offset for offset in offsets)
+    pdf += b'trailer\n<< /Size %d /Root 1 0 R >>\nstartxref\n%d\n%%%%EOF\n' % (len(objects) + 1, xref)
+    return bytes(pdf)
+
+
+def build_request_mix(base_url):
+    """
+    Create a job to rank against and return the request mix as
+    (method, path, body, content type) tuples
+    """
+    request = urllib.request.Request(
+        f'{base_url}/api/jobs',
+        data=json.dumps({
+            'title': 'Load test',
+            'description': 'Python developer building Flask APIs with SQL and Docker',
+            'required_skills': ['Python', 'Flask', 'SQL'],
+            'min_experience': 2
+        }).encode(),
+        headers={'Content-Type': 'application/json'}
+    )
+    with urllib.request.urlopen(request, timeout=30) as response:
+        job_id = json.load(response)['job']['id']
+
+    upload = (
+        f'--{BOUNDARY}\r\nContent-Disposition: form-data; name="file"; filename="load-test.pdf"\r\n'
+        f'Content-Type: application/pdf\r\n\r\n'
+    ).encode() + minimal_pdf(
+        'Jane Doe jane@example.com Python Flask SQL developer with 5 years of experience'
+    ) + f'\r\n--{BOUNDARY}--\r\n'.encode()
+    rank = json.dumps({'job_id': job_id, 'limit': 20}).encode()
+
+    return [('GET', path, b'', None) for path in READ_PATHS] + [
+        ('POST', '/api/upload-resume', upload, f'multipart/form-data; boundary={BOUNDARY}'),
+        ('POST', '/api/rank', rank, 'application/json')
+    ]
+
+
+def free_port():
+    with socket.socket() as sock:
+        sock.bind(('127.0.0.1', 0))
+        return sock.getsockname()[1]
+
+
+def start_server(mode, port, data_dir):
+    """Start a server subprocess on data kept in data_dir and wait until it answers health checks"""
+    if mode == 'flask':
+        command = [sys.executable, '-m', 'flask', '--app', 'app', 'run', '--port', str(port), '--with-threads']
+    else:
+        command = [sys.executable, '-m', 'uvicorn', 'asgi:application', '--port', str(port), '--log-level', 'warning']
+    env = dict(os.environ,
+               DATABASE_URL='sqlite:///' + os.path.join(data_dir, 'load_test.db'),
+               UPLOAD_FOLDER=os.path.join(data_dir, 'uploads'),
+               VECTOR_STORE_PATH=os.path.join(data_dir, 'vectors.bin'))
+    process = subprocess.Popen(command, cwd=ROOT, env=env, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+
+    url = f'http://127.0.0.1:{port}'
+    deadline = time.time() + 30
+    while time.time() < deadline:
+        try:
+            urllib.request.urlopen(f'{url}/api/health', timeout=1).close()
+            return process, url
+        except (urllib.error.URLError, ConnectionError):
+            time.sleep(0.2)
+    process.kill()
+    raise RuntimeError(f'{mode} server did not start on port {port}')
+
+
+async def fetch(connection, host, method, path, body=b'', content_type=None):
+    """Send one request over a keep-alive connection; returns (status, keep_alive)"""
+    reader, writer = connection
+    head = f'{method} {path} HTTP/1.1\r\nHost: {host}\r\n'
+    if body:
+        head += f'Content-Type: {content_type}\r\nContent-Length: {len(body)}\r\n'
+    writer.write(head.encode('latin1') + b'\r\n' + body)
+    await writer.drain()
+
+    status = int((await reader.readline()).split()[1])
+    headers = {}
+    while True:
+        line = await reader.readline()
+        if line in (b'\r\n', b''):
+            break
+        name, _, value = line.decode('latin1').partition(':')
+        headers[name.strip().lower()] = value.strip().lower()
+
+    if 'content-length' in headers:
+        await reader.readexactly(int(headers['content-length']))
+    elif headers.get('transfer-encoding') == 'chunked':
+        while True:
+            size = int((await reader.readline()).split(b';')[0], 16)
+            await reader.readexactly(size + 2)
+            if size == 0:
+                break
+    else:
+        await reader.read()
+        return status, False
+
+    return status, headers.get('connection') != 'close'
+
+
+async def client_loop(base_url, request_mix, offset, stop_at, latencies, errors):
+    url = urlsplit(base_url)
+    connection = None
+    index = offset
+    while time.perf_counter() < stop_at:
+        method, path, body, content_type = request_mix[index % len(request_mix)]
+        index += 1
+        start = time.perf_counter()
+        try:
+            if connection is None:
+                connection = await asyncio.open_connection(url.hostname, url.port or 80)
+            status, keep_alive = await fetch(connection, url.netloc, method, path, body, content_type)
+        except (OSError, asyncio.IncompleteReadError, ValueError, IndexError) as e:
+            errors.append(type(e).__name__)
+            if connection is not None:
+                connection[1].close()
+            connection = None
+            continue
+        if not keep_alive:
+            connection[1].close()
+            connection = None
+        if status >= 500:
+            errors.append(status)
+        latencies.append(time.perf_counter() - start)
+    if connection is not None:
+        connection[1].close()
+
+
+async def run_load(base_url, clients, duration):
+    request_mix = build_request_mix(base_url)
+    latencies, errors = [], []
+    stop_at = time.perf_counter() + duration
+    await asyncio.gather(*(
+        client_loop(base_url, request_mix, i, stop_at, latencies, errors) for i in range(clients)
+    ))
+
+    latencies.sort()
+    percentile = lambda p: latencies[min(len(latencies) - 1, int(p * len(latencies)))] * 1000 if latencies else float('nan')
+    return {
+        'requests': len(latencies),
+        'rps': len(latencies) / duration,
+        'p50': percentile(0.50),
+        'p99': percentile(0.99),
+        'errors': len(errors)
+    }
+
+
+def report(name, stats):
+    print(f"{name:<8} {stats['rps']:9.1f} req/s   p50 {stats['p50']:8.1f} ms   "
+          f"p99 {stats['p99']:8.1f} ms   errors {stats['errors']}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--url', help='test an already running server instead of starting both')
+    parser.add_argument('--clients', type=int, default=200)
+    parser.add_argument('--duration', type=float, default=30)
+    args = parser.parse_args()
+
+    print(f"{args.clients} concurrent clients, {args.duration:.0f}s per server")
+    if args.url:
+        report('server', asyncio.run(run_load(args.url.rstrip('/'), args.clients, args.duration)))
+        return
+
+    for mode in ('flask', 'asgi'):
+        data_dir = tempfile.mkdtemp(prefix=f'load-test-{mode}-')
+        try:
+            process, url = start_server(mode, free_port(), data_dir)
+            try:
+                report(mode, asyncio.run(run_load(url, args.clients, args.duration)))
+            finally:
+                process.terminate()
+                process.wait()
+        finally:
+            shutil.rmtree(data_dir, ignore_errors=True)
+
+
+if __name__ == '__main__':
+    main()
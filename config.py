@@ -15,12 +15,40 @@ class Config:
     
     # Upload settings
     UPLOAD_FOLDER = os.getenv('UPLOAD_FOLDER', 'uploads')
-    ALLOWED_EXTENSIONS = {'pdf', 'docx', 'doc'}
+    ALLOWED_EXTENSIONS = {'pdf', 'docx'}
     MAX_CONTENT_LENGTH = int(os.getenv('MAX_CONTENT_LENGTH', 16 * 1024 * 1024))  # 16MB
+    MAX_RESUME_SIZE = int(os.getenv('MAX_RESUME_SIZE', MAX_CONTENT_LENGTH))
+    UPLOAD_CHUNK_SIZE = int(os.getenv('UPLOAD_CHUNK_SIZE', 64 * 1024))  # 64KB
+    
+    # Stored originals: 'none', 'gzip' or 'zstd' (requires zstandard)
+    BLOB_COMPRESSION = os.getenv('BLOB_COMPRESSION', 'none')
+    # Drop originals this many days after text extraction (unset keeps them forever)
+    UPLOAD_RETENTION_DAYS = int(os.environ['UPLOAD_RETENTION_DAYS']) if os.getenv('UPLOAD_RETENTION_DAYS') else None
+    
+    # Response compression and delta refresh
+    GZIP_MIN_SIZE = int(os.getenv('GZIP_MIN_SIZE', 500))  # Bytes
+    GZIP_LEVEL = int(os.getenv('GZIP_LEVEL', 6))
+    # Cursors are moved back by this much so rows committed late are not missed
+    DELTA_CURSOR_SLACK_SECONDS = int(os.getenv('DELTA_CURSOR_SLACK_SECONDS', 5))
     
     # ML Model settings
     MODEL_PATH = 'models'
     VECTORIZER_PATH = os.path.join(MODEL_PATH, 'vectorizer.pkl')
+    VECTOR_STORE_PATH = os.getenv('VECTOR_STORE_PATH', os.path.join(MODEL_PATH, 'resume_vectors.bin'))
+    VECTOR_STORE_COMPACT_RATIO = float(os.getenv('VECTOR_STORE_COMPACT_RATIO', 0.25))
+    
+    # Batch screening (process pool)
+    SCREENING_WORKERS = int(os.getenv('SCREENING_WORKERS', os.cpu_count() or 1))
+    SCREENING_CHUNK_SIZE = int(os.getenv('SCREENING_CHUNK_SIZE', 500))
+    JOB_PROFILE_CACHE_SIZE = int(os.getenv('JOB_PROFILE_CACHE_SIZE', 256))  # Compiled jobs kept in memory
+    
+    # Sharded ranking: shard_worker.py addresses as host:port,host:port
+    SHARD_ADDRESSES = os.getenv('SHARD_ADDRESSES', '')
+    SHARD_AUTHKEY = os.getenv('SHARD_AUTHKEY', '')  # Required for sharding, never defaulted
+    SHARD_TIMEOUT = float(os.getenv('SHARD_TIMEOUT', 5))  # Seconds before a shard is skipped
+    
+    # ASGI serving mode: threads available to Flask views
+    ASGI_THREADS = int(os.getenv('ASGI_THREADS', 32))
     
     # Skills database
     COMMON_SKILLS = [
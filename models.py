@@ -8,11 +8,12 @@ class Resume(db.Model):
     """Resume model for storing uploaded resumes"""
     
     __tablename__ = 'resumes'
+    __table_args__ = {'sqlite_autoincrement': True}  # Never reuse ids named by tombstones
     
     id = db.Column(db.Integer, primary_key=True)
     filename = db.Column(db.String(255), nullable=False)
     original_filename = db.Column(db.String(255), nullable=False)
-    file_path = db.Column(db.String(500), nullable=False)
+    file_path = db.Column(db.String(500), nullable=False, index=True)  # Blob path, shared by duplicates
     extracted_text = db.Column(db.Text)
     
     # Candidate information
@@ -49,6 +50,7 @@ class JobDescription(db.Model):
     """Job description model"""
     
     __tablename__ = 'job_descriptions'
+    __table_args__ = {'sqlite_autoincrement': True}  # Never reuse ids named by tombstones
     
     id = db.Column(db.Integer, primary_key=True)
     title = db.Column(db.String(200), nullable=False)
@@ -82,6 +84,7 @@ class Screening(db.Model):
     """Screening results model"""
     
     __tablename__ = 'screenings'
+    __table_args__ = {'sqlite_autoincrement': True}  # Never reuse ids named by tombstones
     
     id = db.Column(db.Integer, primary_key=True)
     resume_id = db.Column(db.Integer, db.ForeignKey('resumes.id'), nullable=False)
@@ -123,3 +126,16 @@ class Screening(db.Model):
             'notes': self.notes,
             'screened_at': self.screened_at.isoformat() if self.screened_at else None
         }
+
+
+class Tombstone(db.Model):
+    """Record of a deleted row, so delta queries can report deletions"""
+    
+    __tablename__ = 'tombstones'
+    
+    id = db.Column(db.Integer, primary_key=True)
+    table_name = db.Column(db.String(50), nullable=False, index=True)
+    row_id = db.Column(db.Integer, nullable=False)
+    
+    # Timestamp
+    deleted_at = db.Column(db.DateTime, default=datetime.utcnow, index=True)
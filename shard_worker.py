@@ -0,0 +1,95 @@
+"""
+Shard worker for sharded ranking
+
+Run one worker per shard, on any machine that can reach the database:
+    python shard_worker.py --index 0 --shards 4 --port 7100
+
+or start all shards of a local test cluster on consecutive ports:
+    python shard_worker.py --local 4 --port 7100
+
+then point the web app at them with
+SHARD_ADDRESSES=127.0.0.1:7100,127.0.0.1:7101,...
+
+Each worker ranks from its own vector store file, VECTOR_STORE_PATH with a
+.shard<index>-of-<shards> suffix, built from the database on first start.
+
+Shard connections are pickle-based and authenticated with SHARD_AUTHKEY,
+which must be set to the same secret here and in the web app; workers
+refuse to start without it. Never expose the shard ports outside the
+private network.
+"""
+import argparse
+import multiprocessing
+import os
+
+from flask import Flask
+
+from config import Config
+from models import db
+from utils.shards import ShardServer
+
+
+def create_app() -> Flask:
+    """Minimal app for database access, without the web app's startup work"""
+    app = Flask(__name__)
+    app.config.from_object(Config)
+    db.init_app(app)
+    return app
+
+
+def serve(shard_index: int, num_shards: int, host: str, port: int) -> None:
+    app = create_app()
+    os.makedirs(os.path.dirname(app.config['VECTOR_STORE_PATH']) or '.', exist_ok=True)
+    server = ShardServer(
+        app,
+        shard_index,
+        num_shards,
+        (host, port),
+        authkey=app.config['SHARD_AUTHKEY'].encode(),
+        cache_size=app.config['JOB_PROFILE_CACHE_SIZE']
+    )
+    print(f"Shard {shard_index}/{num_shards} listening on {host}:{port}", flush=True)
+    server.serve_forever()
+
+
+def start_local_shards(num_shards: int, host: str = '127.0.0.1', base_port: int = 7100):
+    """Start num_shards workers as child processes; returns (processes, addresses)"""
+    processes = []
+    addresses = []
+    for shard_index in range(num_shards):
+        address = (host, base_port + shard_index)
+        process = multiprocessing.Process(target=serve, args=(shard_index, num_shards, *address), daemon=True)
+        process.start()
+        processes.append(process)
+        addresses.append(address)
+    return processes, addresses
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--index', type=int, default=0, help='shard served by this worker')
+    parser.add_argument('--shards', type=int, default=1, help='total number of shards')
+    parser.add_argument('--local', type=int, help='start this many shards locally instead')
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=7100)
+    args = parser.parse_args()
+
+    if not Config.SHARD_AUTHKEY:
+        parser.error('SHARD_AUTHKEY must be set to a shared secret')
+
+    if not args.local:
+        serve(args.index, args.shards, args.host, args.port)
+        return
+
+    processes, addresses = start_local_shards(args.local, args.host, args.port)
+    print('SHARD_ADDRESSES=' + ','.join(f'{host}:{port}' for host, port in addresses), flush=True)
+    try:
+        for process in processes:
+            process.join()
+    except KeyboardInterrupt:
+        for process in processes:
+            process.terminate()
+
+
+if __name__ == '__main__':
+    main()
@@ -1,6 +1,42 @@
 // API Base URL
 const API_URL = '/api';
 
+// Client-side cache of list endpoints, refreshed with ETag + ?since= deltas
+const collectionCache = {
+    resumes: { items: new Map(), cursor: null, etag: null, sortKey: 'uploaded_at' },
+    jobs: { items: new Map(), cursor: null, etag: null, sortKey: 'created_at' },
+    screenings: { items: new Map(), cursor: null, etag: null, sortKey: 'screened_at' }
+};
+let analyticsCache = { data: null, etag: null };
+
+async function fetchConditional(url, etag) {
+    const headers = etag ? { 'If-None-Match': etag } : {};
+    return fetch(url, { headers, cache: 'no-store' });
+}
+
+async function syncCollection(name) {
+    const cache = collectionCache[name];
+    const url = cache.cursor
+        ? `${API_URL}/${name}?since=${encodeURIComponent(cache.cursor)}`
+        : `${API_URL}/${name}`;
+    const response = await fetchConditional(url, cache.etag);
+    
+    if (response.status !== 304) {
+        const data = await response.json();
+        if (!response.ok) throw new Error(data.error);
+        
+        // Deletions first, so a row that reuses a deleted id is kept
+        (data.deleted || []).forEach(id => cache.items.delete(id));
+        data[name].forEach(item => cache.items.set(item.id, item));
+        cache.cursor = data.cursor;
+        cache.etag = response.headers.get('ETag');
+    }
+    
+    const items = Array.from(cache.items.values())
+        .sort((a, b) => (b[cache.sortKey] || '').localeCompare(a[cache.sortKey] || ''));
+    return { [name]: items, total: items.length };
+}
+
 // Tab Management
 function showTab(tabName) {
     // Hide all tabs
@@ -142,8 +178,7 @@ function displayResumePreview(resume) {
 
 async function loadResumes() {
     try {
-        const response = await fetch(`${API_URL}/resumes`);
-        const data = await response.json();
+        const data = await syncCollection('resumes');
         
         const listDiv = document.getElementById('resumes-list');
         
@@ -222,8 +257,7 @@ document.getElementById('job-form').addEventListener('submit', async (e) => {
 
 async function loadJobs() {
     try {
-        const response = await fetch(`${API_URL}/jobs`);
-        const data = await response.json();
+        const data = await syncCollection('jobs');
         
         const listDiv = document.getElementById('jobs-list');
         
@@ -268,14 +302,11 @@ async function deleteJob(id) {
 // Screening
 async function loadScreeningOptions() {
     try {
-        const [resumesRes, jobsRes] = await Promise.all([
-            fetch(`${API_URL}/resumes`),
-            fetch(`${API_URL}/jobs`)
+        const [resumesData, jobsData] = await Promise.all([
+            syncCollection('resumes'),
+            syncCollection('jobs')
         ]);
         
-        const resumesData = await resumesRes.json();
-        const jobsData = await jobsRes.json();
-        
         const resumeSelect = document.getElementById('screen-resume');
         const jobSelect = document.getElementById('screen-job');
         
@@ -395,8 +426,7 @@ function displayScreeningResult(screening, resume, job) {
 
 async function loadScreenings() {
     try {
-        const response = await fetch(`${API_URL}/screenings`);
-        const data = await response.json();
+        const data = await syncCollection('screenings');
         
         const listDiv = document.getElementById('screenings-list');
         
@@ -422,8 +452,11 @@ async function loadScreenings() {
 
 async function loadAnalytics() {
     try {
-        const response = await fetch(`${API_URL}/analytics`);
-        const data = await response.json();
+        const response = await fetchConditional(`${API_URL}/analytics`, analyticsCache.etag);
+        if (response.status !== 304) {
+            analyticsCache = { data: await response.json(), etag: response.headers.get('ETag') };
+        }
+        const data = analyticsCache.data;
         
         const analyticsDiv = document.getElementById('analytics-content');
         
@@ -0,0 +1,33 @@
+import os
+import shutil
+import sys
+import tempfile
+
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+# Must be set before config is imported, so the app never touches real data
+DATA_DIR = tempfile.mkdtemp(prefix='resume-screener-tests-')
+os.environ['DATABASE_URL'] = 'sqlite:///' + os.path.join(DATA_DIR, 'test.db')
+os.environ['UPLOAD_FOLDER'] = os.path.join(DATA_DIR, 'uploads')
+os.environ['VECTOR_STORE_PATH'] = os.path.join(DATA_DIR, 'vectors.bin')
+os.environ['SCREENING_WORKERS'] = '1'
+os.environ.pop('SHARD_ADDRESSES', None)
+
+
+def pytest_sessionfinish(session, exitstatus):
+    shutil.rmtree(DATA_DIR, ignore_errors=True)
+
+
+@pytest.fixture
+def app():
+    from app import app
+    with app.app_context():
+        yield app
+
+
+@pytest.fixture
+def client(app):
+    return app.test_client()
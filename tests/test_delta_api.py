@@ -0,0 +1,51 @@
+import json
+
+from models import db, Resume
+
+
+def add_resume(name):
+    resume = Resume(
+        filename=f'{name}.pdf',
+        original_filename=f'{name}.pdf',
+        file_path='',
+        extracted_text=f'{name} Python developer',
+        candidate_name=name,
+        skills_found=json.dumps(['Python']),
+        experience_years=3.0,
+        education_level='Bachelors'
+    )
+    db.session.add(resume)
+    db.session.commit()
+    return resume.id
+
+
+def test_delete_is_reported_by_delta(client):
+    kept = add_resume('kept')
+    deleted = add_resume('deleted')
+
+    first = client.get('/api/resumes')
+    cursor = first.get_json()['cursor']
+    assert client.delete(f'/api/resumes/{deleted}').status_code == 200
+
+    # The old ETag no longer matches, so the client gets the delta, not a 304
+    delta = client.get('/api/resumes', query_string={'since': cursor},
+                       headers={'If-None-Match': first.headers['ETag']})
+    assert delta.status_code == 200
+    payload = delta.get_json()
+    assert deleted in payload['deleted']
+    assert kept not in payload['deleted']
+    assert deleted not in [resume['id'] for resume in payload['resumes']]
+
+
+def test_unchanged_collection_is_not_modified(client):
+    add_resume('unchanged')
+    first = client.get('/api/resumes')
+    cursor = first.get_json()['cursor']
+
+    again = client.get('/api/resumes', query_string={'since': cursor},
+                       headers={'If-None-Match': first.headers['ETag']})
+    assert again.status_code == 304
+
+
+def test_invalid_cursor_is_rejected(client):
+    assert client.get('/api/resumes', query_string={'since': 'yesterday'}).status_code == 400
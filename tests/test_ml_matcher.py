@@ -0,0 +1,83 @@
+import random
+
+import pytest
+
+from config import Config
+from utils.ml_matcher import ResumeJobMatcher
+
+SCORE_KEYS = ['overall_score', 'skill_match_score', 'text_similarity_score',
+              'experience_score', 'education_score']
+EDUCATION_LEVELS = ['High School', 'Diploma', 'Bachelors', 'Masters', 'Phd', 'Not Specified']
+
+
+def make_data(num_resumes, num_jobs, seed=0):
+    """Small synthetic resumes and jobs in the dict format used by screen_resume"""
+    rng = random.Random(seed)
+    vocabulary = [f'term{i}' for i in range(300)] + Config.COMMON_SKILLS
+
+    def text(length):
+        return ' '.join(rng.choice(vocabulary) for _ in range(length))
+
+    resumes = [{
+        'text': text(rng.randint(20, 80)),
+        'skills': rng.sample(Config.COMMON_SKILLS, rng.randint(0, 10)),
+        'experience_years': float(rng.randint(0, 12)),
+        'education': rng.choice(EDUCATION_LEVELS)
+    } for _ in range(num_resumes)]
+    jobs = [{
+        'description': text(rng.randint(10, 50)),
+        'required_skills': rng.sample(Config.COMMON_SKILLS, rng.randint(0, 6)),
+        'preferred_skills': rng.sample(Config.COMMON_SKILLS, rng.randint(0, 4)),
+        'min_experience': float(rng.randint(0, 8)),
+        'education_required': rng.choice(EDUCATION_LEVELS)
+    } for _ in range(num_jobs)]
+    return resumes, jobs
+
+
+def assert_matches_screen_resume(matcher, resumes, jobs):
+    scores = matcher.score_matrix(resumes, jobs)
+    for key in SCORE_KEYS:
+        assert scores[key].shape == (len(resumes), len(jobs))
+
+    for i, resume in enumerate(resumes):
+        for j, job in enumerate(jobs):
+            expected = matcher.screen_resume(resume, job)
+            for key in SCORE_KEYS:
+                assert scores[key][i, j] == pytest.approx(expected[key], abs=1e-6), (i, j, key)
+
+
+@pytest.fixture
+def matcher():
+    return ResumeJobMatcher()
+
+
+def test_score_matrix_matches_screen_resume(matcher):
+    resumes, jobs = make_data(30, 5)
+    assert_matches_screen_resume(matcher, resumes, jobs)
+
+
+def test_score_matrix_falls_back_above_max_features(matcher):
+    # Pairs whose joint vocabulary exceeds max_features are truncated by the
+    # vectorizer, so score_matrix must use the per-pair path for them
+    resumes, jobs = make_data(4, 2)
+    resumes[0]['text'] = ' '.join(f'word{i}' for i in range(matcher.vectorizer.max_features + 200))
+    resumes[1]['text'] = resumes[0]['text'] + ' ' + jobs[0]['description']
+    assert_matches_screen_resume(matcher, resumes, jobs)
+
+
+def test_score_matrix_handles_empty_texts(matcher):
+    resumes, jobs = make_data(3, 2)
+    resumes[0]['text'] = ''
+    resumes[1]['text'] = 'the and of'  # Stop words only
+    jobs[1]['description'] = ''
+    assert_matches_screen_resume(matcher, resumes, jobs)
+
+    scores = matcher.score_matrix(resumes, jobs)
+    assert scores['text_similarity_score'][0].tolist() == [0.0, 0.0]
+    assert scores['text_similarity_score'][:, 1].tolist() == [0.0, 0.0, 0.0]
+
+
+def test_score_matrix_with_no_resumes_or_jobs(matcher):
+    resumes, jobs = make_data(3, 2)
+    assert matcher.score_matrix([], jobs)['overall_score'].shape == (0, 2)
+    assert matcher.score_matrix(resumes, [])['overall_score'].shape == (3, 0)
@@ -0,0 +1,63 @@
+import numpy as np
+import pytest
+
+from test_ml_matcher import SCORE_KEYS, make_data
+from utils.ml_matcher import ResumeJobMatcher
+
+
+def full_ranking(matcher, resumes, job):
+    """Exhaustive ranking: overall score descending, then input order"""
+    scores = matcher.score_matrix(resumes, [job])
+    order = np.argsort(-scores['overall_score'][:, 0], kind='stable')
+    return order, {key: values[:, 0] for key, values in scores.items()}
+
+
+@pytest.fixture
+def matcher():
+    return ResumeJobMatcher()
+
+
+@pytest.mark.parametrize('k', [1, 5, 40, 100])
+def test_rank_top_k_matches_full_sort(matcher, k):
+    resumes, jobs = make_data(40, 3, seed=1)
+    for job in jobs:
+        order, scores = full_ranking(matcher, resumes, job)
+        result = matcher.rank_top_k(resumes, matcher.compile_job(job), k, batch_size=4)
+
+        assert result['indices'].tolist() == order[:k].tolist()
+        for key in SCORE_KEYS:
+            np.testing.assert_allclose(result[key], scores[key][order[:k]], atol=1e-9)
+        assert result['text_scored'] <= len(resumes)
+
+
+def test_rank_top_k_breaks_ties_by_input_order(matcher):
+    resumes, jobs = make_data(10, 1, seed=2)
+    # Every resume appears three times, so every score is tied
+    resumes = [dict(resume) for resume in resumes for _ in range(3)]
+    order, _ = full_ranking(matcher, resumes, jobs[0])
+
+    for k in (1, 2, 3, 7, 30):
+        result = matcher.rank_top_k(resumes, matcher.compile_job(jobs[0]), k, batch_size=2)
+        assert result['indices'].tolist() == order[:k].tolist()
+
+
+def test_rank_top_k_loads_texts_only_for_scored_resumes(matcher):
+    resumes, jobs = make_data(50, 1, seed=3)
+    requested = []
+
+    def load_texts(indices):
+        requested.extend(indices)
+        return [resumes[index]['text'] for index in indices]
+
+    without_text = [{key: value for key, value in resume.items() if key != 'text'} for resume in resumes]
+    result = matcher.rank_top_k(without_text, matcher.compile_job(jobs[0]), 5, load_texts=load_texts)
+    order, _ = full_ranking(matcher, resumes, jobs[0])
+
+    assert result['indices'].tolist() == order[:5].tolist()
+    assert len(requested) == len(set(requested)) == result['text_scored']
+
+
+def test_rank_top_k_with_no_resumes(matcher):
+    _, jobs = make_data(0, 1)
+    result = matcher.rank_top_k([], matcher.compile_job(jobs[0]), 5)
+    assert result['indices'].tolist() == []
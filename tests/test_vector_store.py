@@ -0,0 +1,106 @@
+import os
+
+import numpy as np
+import pytest
+
+from utils.vector_store import ResumeVectorStore, TOMBSTONE, FEATURE_SKILLS
+
+NUM_SKILLS = 11
+DIM = FEATURE_SKILLS + NUM_SKILLS
+
+
+def vector(resume_id):
+    """A distinct feature vector per id: experience, education and a skill pattern"""
+    skills = [(resume_id >> column) & 1 for column in range(NUM_SKILLS)]
+    return np.array([resume_id % 20, resume_id % 6] + skills, dtype=np.float32)
+
+
+def unpacked(store):
+    """Live rows of a store as {resume_id: vector}"""
+    ids, features, skill_bits = store.snapshot()
+    skills = np.unpackbits(skill_bits, axis=1, count=NUM_SKILLS)
+    return {
+        int(resume_id): np.concatenate([features[row], skills[row]]).astype(np.float32)
+        for row, resume_id in enumerate(ids) if resume_id != TOMBSTONE
+    }
+
+
+@pytest.fixture
+def store(tmp_path):
+    return ResumeVectorStore(str(tmp_path / 'vectors.bin'), DIM, initial_capacity=4)
+
+
+def test_append_round_trips_vectors(store):
+    assert store.append_many((resume_id, vector(resume_id)) for resume_id in range(1, 11)) == 10
+
+    rows = unpacked(store)
+    assert sorted(rows) == list(range(1, 11))
+    for resume_id, row in rows.items():
+        np.testing.assert_array_equal(row, vector(resume_id))
+    assert store.live_count() == 10
+
+
+def test_append_skips_stored_and_repeated_ids(store):
+    store.append(1, vector(1))
+    assert not store.append(1, vector(2))
+    assert store.append_many([(2, vector(2)), (1, vector(3)), (2, vector(4))]) == 1
+
+    assert store.live_ids().tolist() == [1, 2]
+    np.testing.assert_array_equal(unpacked(store)[2], vector(2))
+
+
+def test_delete_tombstones_without_rewriting(store):
+    store.append_many((resume_id, vector(resume_id)) for resume_id in range(1, 5))
+    inode = os.stat(store.path).st_ino
+
+    assert store.delete(2)
+    assert not store.delete(2)
+    assert store.delete_many([3, 99]) == 1
+
+    assert store.live_ids().tolist() == [1, 4]
+    assert store.live_count() == 2
+    assert os.stat(store.path).st_ino == inode
+    assert store.needs_compaction()
+
+
+def test_deleted_id_can_be_appended_again(store):
+    store.append_many((resume_id, vector(resume_id)) for resume_id in range(1, 4))
+    store.delete(2)
+
+    assert store.append(2, vector(7))
+    assert sorted(store.live_ids().tolist()) == [1, 2, 3]
+    np.testing.assert_array_equal(unpacked(store)[2], vector(7))
+
+
+def test_compact_drops_tombstones_and_keeps_live_rows(store):
+    store.append_many((resume_id, vector(resume_id)) for resume_id in range(1, 21))
+    store.delete_many(range(1, 21, 2))
+    reader = ResumeVectorStore(store.path, DIM)
+    assert len(reader.live_ids()) == 10
+
+    assert store.compact() == 10
+    assert not store.needs_compaction()
+    ids = store.snapshot()[0]
+    assert TOMBSTONE not in ids.tolist()
+
+    # Another process mapping the old file remaps the compacted one
+    rows = unpacked(reader)
+    assert sorted(rows) == list(range(2, 21, 2))
+    for resume_id, row in rows.items():
+        np.testing.assert_array_equal(row, vector(resume_id))
+
+
+def test_reused_id_survives_compaction(store):
+    store.append_many((resume_id, vector(resume_id)) for resume_id in range(1, 4))
+    store.delete(1)
+    store.append(1, vector(9))
+
+    store.compact()
+    assert sorted(store.live_ids().tolist()) == [1, 2, 3]
+    np.testing.assert_array_equal(unpacked(store)[1], vector(9))
+
+
+def test_store_with_other_dimension_is_replaced(store):
+    store.append(1, vector(1))
+    replaced = ResumeVectorStore(store.path, DIM + 1)
+    assert replaced.live_count() == 0
@@ -0,0 +1,115 @@
+import gzip
+import os
+import shutil
+import tempfile
+import time
+from typing import BinaryIO, Iterator
+
+try:
+    import zstandard
+except ImportError:  # Optional, only needed for BLOB_COMPRESSION=zstd
+    zstandard = None
+
+COMPRESSION_SUFFIXES = {
+    'none': '',
+    'gzip': '.gz',
+    'zstd': '.zst'
+}
+
+
+class BlobStore:
+    """
+    Content-addressed storage for uploaded resume files
+
+    Blobs are named by their sha256 digest and sharded into two levels of
+    directories by digest prefix (ab/cd/abcd...), which keeps every directory
+    small. Identical uploads share one blob; callers own reference counting.
+    """
+
+    def __init__(self, root: str, compression: str = 'none'):
+        if compression not in COMPRESSION_SUFFIXES:
+            raise ValueError(f"Unknown blob compression '{compression}'")
+        if compression == 'zstd' and zstandard is None:
+            raise ValueError("BLOB_COMPRESSION=zstd requires the 'zstandard' package")
+
+        self.root = root
+        self.compression = compression
+        os.makedirs(root, exist_ok=True)
+
+    def path_for(self, digest: str, extension: str) -> str:
+        """Return the storage path of a blob"""
+        name = f"{digest}.{extension}{COMPRESSION_SUFFIXES[self.compression]}"
+        return os.path.join(self.root, digest[:2], digest[2:4], name)
+
+    def _compress(self, src_path: str, dest_file: BinaryIO) -> None:
+        with open(src_path, 'rb') as src:
+            if self.compression == 'gzip':
+                with gzip.GzipFile(fileobj=dest_file, mode='wb') as out:
+                    shutil.copyfileobj(src, out)
+            else:
+                zstandard.ZstdCompressor().copy_stream(src, dest_file)
+
+    def put(self, src_path: str, digest: str, extension: str) -> str:
+        """
+        Move a file into the store and return its blob path
+
+        The source file is consumed either way; if the blob already exists
+        the new copy is simply dropped.
+        """
+        dest_path = self.path_for(digest, extension)
+        if os.path.exists(dest_path):
+            os.remove(src_path)
+            os.utime(dest_path)  # Keep gc from treating it as stale
+            return dest_path
+
+        dest_dir = os.path.dirname(dest_path)
+        os.makedirs(dest_dir, exist_ok=True)
+        if self.compression == 'none':
+            os.replace(src_path, dest_path)
+            return dest_path
+
+        fd, tmp_path = tempfile.mkstemp(dir=dest_dir, suffix='.part')
+        try:
+            with os.fdopen(fd, 'wb') as out:
+                self._compress(src_path, out)
+            os.replace(tmp_path, dest_path)
+        except BaseException:
+            os.remove(tmp_path)
+            raise
+        os.remove(src_path)
+        return dest_path
+
+    @staticmethod
+    def open(path: str) -> BinaryIO:
+        """Open a blob for reading, decompressing it transparently"""
+        if path.endswith('.gz'):
+            return gzip.open(path, 'rb')
+        if path.endswith('.zst'):
+            if zstandard is None:
+                raise ValueError("Reading .zst blobs requires the 'zstandard' package")
+            return zstandard.ZstdDecompressor().stream_reader(open(path, 'rb'), closefd=True)
+        return open(path, 'rb')
+
+    @staticmethod
+    def remove(path: str) -> bool:
+        """Delete a blob if it exists"""
+        if path and os.path.exists(path):
+            os.remove(path)
+            return True
+        return False
+
+    def iter_blobs(self, min_age: float = 0) -> Iterator[str]:
+        """Yield paths of blobs last touched more than min_age seconds ago"""
+        cutoff = time.time() - min_age
+        for first in os.listdir(self.root):
+            first_dir = os.path.join(self.root, first)
+            if len(first) != 2 or not os.path.isdir(first_dir):
+                continue
+            for second in os.listdir(first_dir):
+                second_dir = os.path.join(first_dir, second)
+                if not os.path.isdir(second_dir):
+                    continue
+                with os.scandir(second_dir) as entries:
+                    for entry in entries:
+                        if entry.is_file() and entry.stat().st_mtime < cutoff:
+                            yield entry.path
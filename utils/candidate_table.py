@@ -0,0 +1,151 @@
+import json
+import threading
+import numpy as np
+from typing import Callable, Dict, Iterable, List, Optional, Set, Tuple
+
+from models import db, Resume, Tombstone
+from utils.vector_store import (ResumeVectorStore, resume_feature_vector, TOMBSTONE,
+                                FEATURE_EXPERIENCE, FEATURE_EDUCATION)
+
+# Resume columns needed to encode a feature vector; extracted_text is deliberately absent
+FEATURE_COLUMNS = (Resume.id, Resume.skills_found, Resume.experience_years, Resume.education_level)
+
+
+def shard_store_path(path: str, shard_index: int, num_shards: int) -> str:
+    """Vector store file of one shard, next to the web app's store"""
+    return f"{path}.shard{shard_index}-of-{num_shards}"
+
+
+class CandidateTable:
+    """
+    Keep a ResumeVectorStore in step with the Resume table and rank from it
+
+    The ranking columns (experience, education rank, packed skill bits) live
+    only in the memory-mapped store, which every process maps from the page
+    cache, so no process holds its own copy of the corpus. This class follows
+    the database incrementally: refresh() adds rows above the highest id seen
+    and removes rows named by new tombstones, whichever process made the
+    change. partition is an optional SQL filter restricting the table to a
+    shard, whose store must then hold only that partition.
+    """
+
+    def __init__(self, store: ResumeVectorStore, skill_list: List[str], partition=None):
+        self.store = store
+        self.skill_list = list(skill_list)
+        self.partition = partition
+        self.max_id = 0
+        self.last_tombstone = 0
+        self._lock = threading.Lock()
+        self._loaded = False
+
+    # ==================== Database sync ====================
+
+    def _query(self, *columns):
+        query = db.session.query(*columns)
+        if self.partition is not None:
+            query = query.filter(self.partition)
+        return query
+
+    def _vectors(self, rows: Iterable[Tuple]) -> Iterable[Tuple]:
+        """(resume_id, vector) pairs from FEATURE_COLUMNS rows"""
+        for resume_id, skills_found, experience_years, education_level in rows:
+            yield resume_id, resume_feature_vector({
+                'skills': json.loads(skills_found) if skills_found else [],
+                'experience_years': experience_years or 0,
+                'education': education_level or 'Not Specified'
+            }, self.skill_list)
+
+    def _repair(self, db_ids: Set[int], stored_ids: Set[int]) -> Tuple[int, int]:
+        """Make the store hold exactly db_ids; returns (added, removed)"""
+        removed = self.store.delete_many(stored_ids - db_ids) if stored_ids - db_ids else 0
+        missing = db_ids - stored_ids
+        added = 0
+        if missing:
+            rows = self._query(*FEATURE_COLUMNS).order_by(Resume.id).yield_per(1000)
+            added = self.store.append_many(self._vectors(row for row in rows if row[0] in missing))
+        return added, removed
+
+    def load(self) -> Tuple[int, int]:
+        """
+        Reconcile the store with the database, e.g. at startup
+
+        Only rows that differ are added or removed, so an up-to-date store is
+        left untouched. Returns (added, removed).
+        """
+        with self._lock:
+            # Read the tombstone mark first so no delete in between is missed
+            self.last_tombstone = db.session.query(db.func.max(Tombstone.id)).scalar() or 0
+            db_ids = {resume_id for (resume_id,) in self._query(Resume.id)}
+            self.max_id = max(db_ids, default=0)
+            changes = self._repair(db_ids, set(self.store.live_ids().tolist()))
+            self._loaded = True
+            return changes
+
+    def refresh(self) -> None:
+        """Apply inserts and deletes made since the last refresh"""
+        if not self._loaded:
+            self.load()
+            return
+
+        with self._lock:
+            rows = self._query(*FEATURE_COLUMNS).filter(Resume.id > self.max_id).order_by(Resume.id).all()
+            if rows:
+                self.store.append_many(self._vectors(rows))
+                self.max_id = rows[-1][0]
+
+            tombstones = db.session.query(Tombstone.id, Tombstone.row_id).filter(
+                Tombstone.table_name == Resume.__tablename__,
+                Tombstone.id > self.last_tombstone
+            ).order_by(Tombstone.id).all()
+            if tombstones:
+                self.store.delete_many(row_id for _, row_id in tombstones)
+                self.last_tombstone = tombstones[-1][0]
+
+            # Rows committed out of id order can slip under max_id. Counting
+            # only up to max_id keeps concurrent inserts above it from
+            # tripping the check; a mismatch repairs just the differing ids
+            stored_ids = self.store.live_ids()
+            stored_ids = stored_ids[stored_ids <= self.max_id]
+            if self._query(db.func.count(Resume.id)).filter(Resume.id <= self.max_id).scalar() != len(stored_ids):
+                db_ids = {resume_id for (resume_id,) in self._query(Resume.id).filter(Resume.id <= self.max_id)}
+                self._repair(db_ids, set(stored_ids.tolist()))
+
+    # ==================== Ranking ====================
+
+    def snapshot(self, resume_ids: Optional[List[int]] = None) -> Dict:
+        """
+        Ranking columns of the stored resumes, in id order
+
+        Returns a dictionary for ResumeJobMatcher.rank_candidates: 'ids',
+        'experience_years' and 'education_rank' are copies, while
+        'skill_bits' stays a view over the mapping and 'skill_rows' picks the
+        rows of it that belong to 'ids', so only the job's skill bits are read.
+        """
+        ids, features, skill_bits = self.store.snapshot()
+        ids = np.array(ids)  # Deletes tombstone ids in place
+        rows = np.flatnonzero(ids != TOMBSTONE)
+        if resume_ids is not None:
+            rows = rows[np.isin(ids[rows], np.fromiter(resume_ids, dtype=np.int64))]
+        rows = rows[np.argsort(ids[rows], kind='stable')]
+
+        return {
+            'ids': ids[rows],
+            'experience_years': features[rows, FEATURE_EXPERIENCE].astype(np.float64),
+            'education_rank': features[rows, FEATURE_EDUCATION].astype(np.int64),
+            'skill_bits': skill_bits,
+            'skill_rows': rows,
+            'skill_names': self.skill_list
+        }
+
+    @staticmethod
+    def text_loader(snapshot: Dict) -> Callable[[List[int]], List[str]]:
+        """load_texts callback for ResumeJobMatcher.rank_candidates over a snapshot"""
+        def load_texts(positions):
+            wanted = [int(snapshot['ids'][position]) for position in positions]
+            texts = dict(db.session.query(Resume.id, Resume.extracted_text).filter(Resume.id.in_(wanted)))
+            # A resume deleted since the snapshot simply scores no text
+            return [texts.get(resume_id) or '' for resume_id in wanted]
+        return load_texts
+
+    def __len__(self) -> int:
+        return self.store.live_count()
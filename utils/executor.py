@@ -0,0 +1,164 @@
+import mmap
+import multiprocessing as mp
+import os
+import pickle
+import tempfile
+import threading
+import numpy as np
+from typing import Dict, List, Optional, Tuple
+
+from utils.job_profile import JobProfile
+from utils.ml_matcher import ResumeJobMatcher
+from utils.pdf_parser import ResumeParser
+
+SCORE_KEYS = ['overall_score', 'skill_match_score', 'text_similarity_score',
+              'experience_score', 'education_score']
+
+# Batches are exchanged through memory-mapped temp files, in RAM where /dev/shm exists
+BATCH_DIR = '/dev/shm' if os.path.isdir('/dev/shm') else None
+
+# Per-worker state: the matcher, set once when the worker starts, and the
+# job encoding of the batch read most recently
+_worker_state = {}
+
+
+def _init_worker(matcher: ResumeJobMatcher) -> None:
+    _worker_state['matcher'] = matcher
+
+
+def _read_slice(path: str, offset: int, length: int):
+    with open(path, 'rb') as f:
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as view:
+            return pickle.loads(view[offset:offset + length])
+
+
+def _score_chunk(task: Tuple) -> None:
+    """Score one chunk of a batch and write its rows into the batch output file"""
+    input_path, job_slice, chunk_slice, output_path, shape, start, stop = task
+    matcher = _worker_state['matcher']
+
+    # Consecutive chunks of a batch share one decoded job encoding
+    if _worker_state.get('job_path') != input_path:
+        _worker_state['job_encoding'] = _read_slice(input_path, *job_slice)
+        _worker_state['job_path'] = input_path
+    job_encoding = _worker_state['job_encoding']
+
+    resume_encoding = matcher.encode_resumes(_read_slice(input_path, *chunk_slice), job_encoding)
+    scores = matcher.score_encoded(resume_encoding, job_encoding)
+
+    output = np.memmap(output_path, dtype=np.float64, mode='r+', shape=shape)
+    for index, key in enumerate(SCORE_KEYS):
+        output[index, start:stop] = scores[key]
+    output.flush()
+
+
+def _parse_file(task: Tuple[str, List[str]]) -> Dict:
+    """Parse a single resume with the batch skill list"""
+    file_path, skill_list = task
+    return ResumeParser.parse_resume(file_path, skill_list)
+
+
+class ScreeningExecutor:
+    """
+    Shard CPU-bound screening and parsing batches across a persistent process pool
+
+    The pool is forked once by start() and reused by every later batch.
+    """
+
+    def __init__(self, matcher: Optional[ResumeJobMatcher] = None,
+                 workers: int = None, chunk_size: int = 500):
+        self.matcher = matcher or ResumeJobMatcher()
+        self.workers = max(1, workers or mp.cpu_count())
+        self.chunk_size = max(1, chunk_size)
+        self._pool = None
+        self._pool_lock = threading.Lock()
+
+    @staticmethod
+    def _fork_context():
+        """Return a fork multiprocessing context, or None where fork is unavailable"""
+        if 'fork' not in mp.get_all_start_methods():
+            return None
+        return mp.get_context('fork')
+
+    def start(self) -> None:
+        """
+        Fork the persistent worker pool
+
+        Call this once at startup, before the server starts its threads: a
+        child forked while another thread holds a lock can deadlock. Batches
+        run in the calling process until the pool has been started.
+        """
+        with self._pool_lock:
+            context = self._fork_context()
+            if self._pool is None and self.workers > 1 and context is not None:
+                self._pool = context.Pool(self.workers, initializer=_init_worker, initargs=(self.matcher,))
+
+    def close(self) -> None:
+        with self._pool_lock:
+            if self._pool is not None:
+                self._pool.terminate()
+                self._pool.join()
+                self._pool = None
+
+    def _chunks(self, total: int) -> List[Tuple[int, int]]:
+        return [(start, min(start + self.chunk_size, total))
+                for start in range(0, total, self.chunk_size)]
+
+    def _use_pool(self, total: int, chunk_size: int) -> bool:
+        return self._pool is not None and total > chunk_size
+
+    def score_matrix(self, resumes: List[Dict], jobs: List[Dict]) -> Dict[str, np.ndarray]:
+        """Parallel equivalent of ResumeJobMatcher.score_matrix"""
+        return self.score_profiles(resumes, [self.matcher.compile_job(job) for job in jobs])
+
+    def score_profiles(self, resumes: List[Dict], profiles: List[JobProfile]) -> Dict[str, np.ndarray]:
+        """
+        Score resumes against compiled jobs
+
+        Jobs are encoded once in the parent. Resumes are split into chunks of
+        chunk_size rows; the batch is written once to a memory-mapped input
+        file, and each worker writes its rows straight into a memory-mapped
+        result file. The pool is shared, so concurrent calls interleave their
+        chunks instead of waiting for each other.
+        """
+        job_encoding = self.matcher.encode_profiles(profiles)
+
+        if not self._use_pool(len(resumes), self.chunk_size):
+            resume_encoding = self.matcher.encode_resumes(resumes, job_encoding)
+            return self.matcher.score_encoded(resume_encoding, job_encoding)
+
+        shape = (len(SCORE_KEYS), len(resumes), len(profiles))
+        input_fd, input_path = tempfile.mkstemp(prefix='screening-in-', dir=BATCH_DIR)
+        output_fd, output_path = tempfile.mkstemp(prefix='screening-out-', dir=BATCH_DIR)
+        try:
+            tasks = []
+            with os.fdopen(input_fd, 'wb') as f:
+                job_bytes = pickle.dumps(job_encoding, protocol=pickle.HIGHEST_PROTOCOL)
+                f.write(job_bytes)
+                offset = len(job_bytes)
+                for start, stop in self._chunks(len(resumes)):
+                    chunk_bytes = pickle.dumps(resumes[start:stop], protocol=pickle.HIGHEST_PROTOCOL)
+                    f.write(chunk_bytes)
+                    tasks.append((input_path, (0, len(job_bytes)), (offset, len(chunk_bytes)),
+                                  output_path, shape, start, stop))
+                    offset += len(chunk_bytes)
+            with os.fdopen(output_fd, 'wb') as f:
+                f.truncate(int(np.prod(shape)) * 8)
+
+            self._pool.map(_score_chunk, tasks, chunksize=1)
+            output = np.array(np.memmap(output_path, dtype=np.float64, mode='r', shape=shape))
+        finally:
+            os.remove(input_path)
+            os.remove(output_path)
+
+        return {key: output[index] for index, key in enumerate(SCORE_KEYS)}
+
+    def parse_resumes(self, file_paths: List[str], skill_list: List[str]) -> List[Dict]:
+        """Parallel equivalent of ResumeParser.parse_resume over many files"""
+        # Files are far costlier than score rows, so never hand one worker
+        # more than its share of the batch
+        chunk_size = min(self.chunk_size, -(-len(file_paths) // self.workers))
+        if not self._use_pool(len(file_paths), chunk_size):
+            return [ResumeParser.parse_resume(path, skill_list) for path in file_paths]
+
+        return self._pool.map(_parse_file, [(path, skill_list) for path in file_paths], chunksize=chunk_size)
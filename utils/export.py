@@ -0,0 +1,64 @@
+import csv
+import io
+import json
+from typing import Dict, Iterable, Iterator, List
+
+EXPORT_FORMATS = {
+    'csv': 'text/csv',
+    'ndjson': 'application/x-ndjson'
+}
+
+EXPORT_COLUMNS = [
+    'id', 'resume_id', 'job_id', 'candidate_name', 'candidate_email', 'resume_filename',
+    'job_title', 'overall_score', 'skill_match_score', 'experience_score', 'education_score',
+    'text_similarity_score', 'recommendation', 'matched_skills', 'missing_skills', 'notes',
+    'screened_at'
+]
+
+JSON_LIST_COLUMNS = ('matched_skills', 'missing_skills')
+
+
+def normalize_row(row: Dict) -> Dict:
+    """Decode JSON columns and timestamps of an export row"""
+    record = {column: row[column] for column in EXPORT_COLUMNS}
+    for column in JSON_LIST_COLUMNS:
+        record[column] = json.loads(record[column]) if record[column] else []
+    if record['screened_at'] is not None:
+        record['screened_at'] = record['screened_at'].isoformat()
+    return record
+
+
+def csv_chunk(rows: List[Dict], include_header: bool = False) -> str:
+    """Render rows as CSV text, with skill lists joined by '; '"""
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    if include_header:
+        writer.writerow(EXPORT_COLUMNS)
+    for row in rows:
+        record = normalize_row(row)
+        for column in JSON_LIST_COLUMNS:
+            record[column] = '; '.join(record[column])
+        writer.writerow([record[column] for column in EXPORT_COLUMNS])
+    return buffer.getvalue()
+
+
+def ndjson_chunk(rows: List[Dict]) -> str:
+    """Render rows as newline-delimited JSON"""
+    return ''.join(json.dumps(normalize_row(row)) + '\n' for row in rows)
+
+
+def export_chunks(partitions: Iterable[List[Dict]], export_format: str,
+                  include_header: bool = True) -> Iterator[str]:
+    """
+    Render row partitions one at a time
+
+    Only one partition is held in memory, so memory use is bounded by the
+    partition size regardless of the number of rows exported.
+    """
+    if export_format == 'csv' and include_header:
+        yield csv_chunk([], include_header=True)
+    for rows in partitions:
+        if export_format == 'csv':
+            yield csv_chunk(rows)
+        else:
+            yield ndjson_chunk(rows)
@@ -0,0 +1,72 @@
+import threading
+from collections import OrderedDict
+from typing import Callable, Dict, Hashable, List, Tuple
+
+
+class JobProfile:
+    """
+    Job description compiled once for repeated screening
+
+    Built by ResumeJobMatcher.compile_job. Holds everything screen_resume
+    would otherwise recompute for every resume: lowercased skill lists,
+    the education rank and the description's term counts.
+    """
+
+    __slots__ = (
+        'description', 'required_skills', 'preferred_skills', 'required_lower',
+        'preferred_lower', 'min_experience', 'education_rank', 'term_counts',
+        'term_sq_norm', 'weights'
+    )
+
+    def __init__(self, description: str, required_skills: List[str], preferred_skills: List[str],
+                 min_experience: float, education_rank: int, term_counts: Dict[str, int],
+                 weights: Tuple[float, float, float, float]):
+        self.description = description
+        self.required_skills = list(required_skills)
+        self.preferred_skills = list(preferred_skills)
+        self.required_lower = [skill.lower() for skill in required_skills]
+        self.preferred_lower = [skill.lower() for skill in preferred_skills]
+        self.min_experience = min_experience
+        self.education_rank = education_rank
+        self.term_counts = term_counts
+        self.term_sq_norm = sum(count * count for count in term_counts.values())
+        self.weights = weights
+
+
+class JobProfileCache:
+    """Thread-safe LRU cache of JobProfiles keyed by job id and revision"""
+
+    def __init__(self, capacity: int = 256):
+        self.capacity = max(1, capacity)
+        self._profiles = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, job_id: Hashable, revision: Hashable, build: Callable[[], JobProfile]) -> JobProfile:
+        """
+        Return the cached profile for job_id, rebuilding it if revision changed
+
+        revision is typically the job's updated_at, so editing a job
+        invalidates its profile on the next lookup.
+        """
+        with self._lock:
+            entry = self._profiles.get(job_id)
+            if entry is not None and entry[0] == revision:
+                self._profiles.move_to_end(job_id)
+                return entry[1]
+
+        # Build outside the lock; a concurrent duplicate build is harmless
+        profile = build()
+        with self._lock:
+            self._profiles[job_id] = (revision, profile)
+            self._profiles.move_to_end(job_id)
+            while len(self._profiles) > self.capacity:
+                self._profiles.popitem(last=False)
+        return profile
+
+    def invalidate(self, job_id: Hashable) -> None:
+        """Drop the profile of a deleted or changed job"""
+        with self._lock:
+            self._profiles.pop(job_id, None)
+
+    def __len__(self) -> int:
+        return len(self._profiles)
@@ -1,12 +1,28 @@
 import numpy as np
+from scipy import sparse
 from sklearn.feature_extraction.text import TfidfVectorizer
 from sklearn.metrics.pairwise import cosine_similarity
-from typing import Dict, List, Tuple
+from collections import Counter
+from typing import Callable, Dict, List, Tuple
+import heapq
 import json
 
+from utils.job_profile import JobProfile
+
 class ResumeJobMatcher:
     """Machine Learning based resume and job description matcher"""
     
+    EDUCATION_HIERARCHY = {
+        'high school': 1,
+        'diploma': 2,
+        'bachelors': 3,
+        'masters': 4,
+        'phd': 5
+    }
+    
+    # Weights of skill match, text similarity, experience and education
+    SCORE_WEIGHTS = (0.40, 0.25, 0.20, 0.15)
+    
     def __init__(self):
         self.vectorizer = TfidfVectorizer(
             max_features=1000,
@@ -84,17 +100,13 @@ class ResumeJobMatcher:
     def calculate_education_score(self, candidate_education: str, 
                                   required_education: str) -> float:
         """Calculate education match score"""
-        education_hierarchy = {
-            'high school': 1,
-            'diploma': 2,
-            'bachelors': 3,
-            'masters': 4,
-            'phd': 5
-        }
-        
-        candidate_level = education_hierarchy.get(candidate_education.lower(), 0)
-        required_level = education_hierarchy.get(required_education.lower(), 0)
-        
+        candidate_level = self.EDUCATION_HIERARCHY.get(candidate_education.lower(), 0)
+        required_level = self.EDUCATION_HIERARCHY.get(required_education.lower(), 0)
+        return self.education_score_from_levels(candidate_level, required_level)
+    
+    @staticmethod
+    def education_score_from_levels(candidate_level: int, required_level: int) -> float:
+        """Calculate education match score from education hierarchy ranks"""
         if required_level == 0:
             return 100.0  # No requirement specified
         
@@ -185,12 +197,20 @@ class ResumeJobMatcher:
             job_data.get('education_required', 'Not Specified')
         )
         
+        return self._screening_result(skill_match, text_similarity, experience_score, education_score)
+    
+    def _screening_result(self, skill_match: Dict, text_similarity: float,
+                          experience_score: float, education_score: float,
+                          weights: Tuple[float, float, float, float] = None) -> Dict:
+        """Combine component scores into the screen_resume result dictionary"""
+        skill_weight, text_weight, experience_weight, education_weight = weights or self.SCORE_WEIGHTS
+        
         # Calculate overall score (weighted average)
         overall_score = (
-            skill_match['overall_score'] * 0.40 +  # 40% weight on skills
-            text_similarity * 0.25 +                # 25% weight on text similarity
-            experience_score * 0.20 +               # 20% weight on experience
-            education_score * 0.15                  # 15% weight on education
+            skill_match['overall_score'] * skill_weight +  # 40% weight on skills
+            text_similarity * text_weight +                # 25% weight on text similarity
+            experience_score * experience_weight +         # 20% weight on experience
+            education_score * education_weight             # 15% weight on education
         )
         
         # Cap overall score at 100
@@ -221,3 +241,471 @@ class ResumeJobMatcher:
             'recommendation': recommendation,
             'notes': notes
         }
+    
+    # ==================== Job Profiles ====================
+    
+    def compile_job(self, job_data: Dict) -> JobProfile:
+        """Precompute the job-side work of screen_resume, see JobProfile"""
+        description = job_data.get('description', '')
+        return JobProfile(
+            description=description,
+            required_skills=job_data.get('required_skills', []),
+            preferred_skills=job_data.get('preferred_skills') or [],
+            min_experience=job_data.get('min_experience', 0),
+            education_rank=self.EDUCATION_HIERARCHY.get(job_data.get('education_required', 'Not Specified').lower(), 0),
+            term_counts=Counter(self.vectorizer.build_analyzer()(description)),
+            weights=self.SCORE_WEIGHTS
+        )
+    
+    def _profile_skill_match(self, resume_skills: List[str], profile: JobProfile) -> Dict:
+        """calculate_skill_match against a compiled job, using set lookups"""
+        resume_skills_lower = {skill.lower() for skill in resume_skills}
+        
+        matched_required = [skill for skill, lower in zip(profile.required_skills, profile.required_lower)
+                            if lower in resume_skills_lower]
+        missing_required = [skill for skill, lower in zip(profile.required_skills, profile.required_lower)
+                            if lower not in resume_skills_lower]
+        matched_preferred = [skill for skill, lower in zip(profile.preferred_skills, profile.preferred_lower)
+                             if lower in resume_skills_lower]
+        missing_preferred = [skill for skill, lower in zip(profile.preferred_skills, profile.preferred_lower)
+                             if lower not in resume_skills_lower]
+        
+        required_score = (len(matched_required) / len(profile.required_skills) * 100) if profile.required_skills else 0
+        preferred_score = (len(matched_preferred) / len(profile.preferred_skills) * 100) if profile.preferred_skills else 0
+        
+        return {
+            'overall_score': (required_score * 0.7) + (preferred_score * 0.3),
+            'required_score': required_score,
+            'preferred_score': preferred_score,
+            'matched_required': matched_required,
+            'missing_required': missing_required,
+            'matched_preferred': matched_preferred,
+            'missing_preferred': missing_preferred,
+            'total_matched': len(matched_required) + len(matched_preferred),
+            'total_missing': len(missing_required) + len(missing_preferred)
+        }
+    
+    def _profile_text_similarity(self, resume_text: str, profile: JobProfile) -> float:
+        """
+        calculate_text_similarity against a compiled job
+        
+        Uses the same closed form as the batch path: only the resume needs to
+        be tokenized, no vectorizer is fitted.
+        """
+        resume_counts = Counter(self.vectorizer.build_analyzer()(resume_text))
+        job_counts = profile.term_counts
+        
+        max_features = self.vectorizer.max_features
+        shared = [term for term in resume_counts if term in job_counts]
+        if max_features is not None and len(resume_counts) + len(job_counts) - len(shared) > max_features:
+            return self.calculate_text_similarity(resume_text, profile.description)
+        
+        dot = sum(resume_counts[term] * job_counts[term] for term in shared)
+        resume_shared_sq = sum(resume_counts[term] ** 2 for term in shared)
+        job_shared_sq = sum(job_counts[term] ** 2 for term in shared)
+        resume_sq = sum(count * count for count in resume_counts.values())
+        
+        shared_idf, unique_idf = self._idf_weights()
+        resume_norm_sq = unique_idf ** 2 * resume_sq - (unique_idf ** 2 - shared_idf ** 2) * resume_shared_sq
+        job_norm_sq = unique_idf ** 2 * profile.term_sq_norm - (unique_idf ** 2 - shared_idf ** 2) * job_shared_sq
+        
+        denominator = np.sqrt(resume_norm_sq * job_norm_sq)
+        if denominator <= 0:
+            return 0.0
+        return float(min(max(shared_idf ** 2 * dot / denominator, 0.0), 1.0) * 100)
+    
+    def screen_resume_profile(self, resume_data: Dict, profile: JobProfile) -> Dict:
+        """screen_resume against a compiled job, for screening many resumes per job"""
+        skill_match = self._profile_skill_match(resume_data.get('skills', []), profile)
+        text_similarity = self._profile_text_similarity(resume_data.get('text', ''), profile)
+        experience_score = self.calculate_experience_score(
+            resume_data.get('experience_years', 0),
+            profile.min_experience
+        )
+        education_score = self.education_score_from_levels(
+            self.EDUCATION_HIERARCHY.get(resume_data.get('education', 'Not Specified').lower(), 0),
+            profile.education_rank
+        )
+        
+        return self._screening_result(skill_match, text_similarity, experience_score, education_score,
+                                      weights=profile.weights)
+    
+    # ==================== Batch Scoring ====================
+    
+    def _idf_weights(self) -> Tuple[float, float]:
+        """
+        IDF weights used by the pairwise TF-IDF fit in calculate_text_similarity.
+        
+        With only two documents in the corpus a term is either shared (df=2)
+        or unique to one side (df=1), so the IDF reduces to two constants.
+        """
+        smooth = int(self.vectorizer.smooth_idf)
+        shared_idf = np.log((2 + smooth) / (2 + smooth)) + 1
+        unique_idf = np.log((2 + smooth) / (1 + smooth)) + 1
+        return shared_idf, unique_idf
+    
+    @staticmethod
+    def _count_matrix(rows: List[Dict[str, int]], index: Dict[str, int]) -> sparse.csr_matrix:
+        """Build a sparse count matrix from per-row term counts, ignoring terms outside index"""
+        indptr = [0]
+        indices = []
+        data = []
+        for counts in rows:
+            for term, count in counts.items():
+                column = index.get(term)
+                if column is not None:
+                    indices.append(column)
+                    data.append(count)
+            indptr.append(len(indices))
+        
+        return sparse.csr_matrix(
+            (np.asarray(data, dtype=np.float64), np.asarray(indices, dtype=np.int64), indptr),
+            shape=(len(rows), len(index))
+        )
+    
+    def encode_jobs(self, jobs: List[Dict]) -> Dict:
+        """Encode job descriptions for batch scoring, see encode_profiles"""
+        return self.encode_profiles([self.compile_job(job) for job in jobs])
+    
+    def encode_profiles(self, profiles: List[JobProfile]) -> Dict:
+        """
+        Encode compiled jobs for batch scoring
+        
+        Term and skill vocabularies are built from the job side only: resume
+        terms that no job uses never contribute to a dot product, so resumes
+        only need their out-of-vocabulary norm and term count.
+        """
+        term_index = {}
+        for profile in profiles:
+            for term in profile.term_counts:
+                term_index.setdefault(term, len(term_index))
+        
+        required = [Counter(profile.required_lower) for profile in profiles]
+        preferred = [Counter(profile.preferred_lower) for profile in profiles]
+        skill_index = {}
+        for counts in required + preferred:
+            for skill in counts:
+                skill_index.setdefault(skill, len(skill_index))
+        
+        return {
+            'texts': [profile.description for profile in profiles],
+            'term_index': term_index,
+            'terms': self._count_matrix([profile.term_counts for profile in profiles], term_index),
+            'skill_index': skill_index,
+            'required_skills': self._count_matrix(required, skill_index),
+            'preferred_skills': self._count_matrix(preferred, skill_index),
+            'required_count': np.array([len(profile.required_skills) for profile in profiles], dtype=np.float64),
+            'preferred_count': np.array([len(profile.preferred_skills) for profile in profiles], dtype=np.float64),
+            'min_experience': np.array([profile.min_experience for profile in profiles], dtype=np.float64),
+            'education_rank': np.array([profile.education_rank for profile in profiles], dtype=np.int64),
+            'weights': np.array([profile.weights for profile in profiles], dtype=np.float64).reshape(len(profiles), 4).T
+        }
+    
+    def encode_resumes(self, resumes: List[Dict], job_encoding: Dict) -> Dict:
+        """Encode resumes against the vocabularies of an encoded job batch"""
+        encoding = self.encode_resume_texts([resume.get('text', '') for resume in resumes], job_encoding)
+        encoding.update(self.encode_resume_features(resumes, job_encoding))
+        return encoding
+    
+    def encode_resume_texts(self, texts: List[str], job_encoding: Dict) -> Dict:
+        """Encode resume texts for _text_similarity_matrix"""
+        analyzer = self.vectorizer.build_analyzer()
+        term_index = job_encoding['term_index']
+        
+        term_counts = []
+        oov_squares = np.zeros(len(texts), dtype=np.float64)
+        term_totals = np.zeros(len(texts), dtype=np.float64)
+        for i, text in enumerate(texts):
+            counts = Counter(analyzer(text))
+            term_counts.append(counts)
+            term_totals[i] = len(counts)
+            oov_squares[i] = sum(count * count for term, count in counts.items() if term not in term_index)
+        
+        return {
+            'texts': texts,
+            'terms': self._count_matrix(term_counts, term_index),
+            'oov_squares': oov_squares,
+            'term_totals': term_totals
+        }
+    
+    def encode_resume_features(self, resumes: List[Dict], job_encoding: Dict) -> Dict:
+        """Encode the skills, experience and education of resumes; text is not needed"""
+        skills = [{skill.lower(): 1 for skill in resume.get('skills', [])} for resume in resumes]
+        
+        return {
+            'skills': self._count_matrix(skills, job_encoding['skill_index']),
+            'experience_years': np.array([resume.get('experience_years', 0) for resume in resumes], dtype=np.float64),
+            'education_rank': np.array([
+                self.EDUCATION_HIERARCHY.get(resume.get('education', 'Not Specified').lower(), 0)
+                for resume in resumes
+            ], dtype=np.int64)
+        }
+    
+    def _text_similarity_matrix(self, resume_encoding: Dict, job_encoding: Dict) -> np.ndarray:
+        """Vectorized equivalent of calculate_text_similarity for every resume/job pair"""
+        resume_terms = resume_encoding['terms']
+        job_terms = job_encoding['terms']
+        resume_present = resume_terms.sign()
+        job_present = job_terms.sign()
+        
+        dot = (resume_terms @ job_terms.T).toarray()
+        shared_terms = (resume_present @ job_present.T).toarray()
+        resume_shared_sq = (resume_terms.multiply(resume_terms) @ job_present.T).toarray()
+        job_shared_sq = (resume_present @ job_terms.multiply(job_terms).T).toarray()
+        
+        resume_sq = np.asarray(resume_terms.multiply(resume_terms).sum(axis=1)).ravel() + resume_encoding['oov_squares']
+        job_sq = np.asarray(job_terms.multiply(job_terms).sum(axis=1)).ravel()
+        
+        # Shared terms are weighted by shared_idf, all others by unique_idf
+        shared_idf, unique_idf = self._idf_weights()
+        resume_norm_sq = unique_idf ** 2 * resume_sq[:, None] - (unique_idf ** 2 - shared_idf ** 2) * resume_shared_sq
+        job_norm_sq = unique_idf ** 2 * job_sq[None, :] - (unique_idf ** 2 - shared_idf ** 2) * job_shared_sq
+        
+        denominator = np.sqrt(resume_norm_sq * job_norm_sq)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            similarity = np.where(denominator > 0, shared_idf ** 2 * dot / denominator, 0.0)
+        similarity = np.clip(similarity, 0.0, 1.0) * 100
+        
+        # Pairs whose joint vocabulary exceeds max_features are truncated by
+        # the vectorizer, which has no closed form; score those pair by pair.
+        max_features = self.vectorizer.max_features
+        if max_features is not None:
+            job_totals = np.diff(job_terms.indptr)
+            vocabulary_size = resume_encoding['term_totals'][:, None] + job_totals[None, :] - shared_terms
+            for i, j in zip(*np.nonzero(vocabulary_size > max_features)):
+                similarity[i, j] = self.calculate_text_similarity(
+                    resume_encoding['texts'][i], job_encoding['texts'][j]
+                )
+        
+        return similarity
+    
+    def _skill_score_matrix(self, resume_encoding: Dict, job_encoding: Dict) -> np.ndarray:
+        """Vectorized equivalent of calculate_skill_match()['overall_score']"""
+        resume_skills = resume_encoding['skills']
+        matched_required = (resume_skills @ job_encoding['required_skills'].T).toarray()
+        matched_preferred = (resume_skills @ job_encoding['preferred_skills'].T).toarray()
+        
+        required_count = job_encoding['required_count'][None, :]
+        preferred_count = job_encoding['preferred_count'][None, :]
+        with np.errstate(divide='ignore', invalid='ignore'):
+            required_score = np.where(required_count > 0, matched_required / required_count * 100, 0.0)
+            preferred_score = np.where(preferred_count > 0, matched_preferred / preferred_count * 100, 0.0)
+        
+        return (required_score * 0.7) + (preferred_score * 0.3)
+    
+    @staticmethod
+    def _experience_score_matrix(candidate_years: np.ndarray, required_years: np.ndarray) -> np.ndarray:
+        """Vectorized equivalent of calculate_experience_score"""
+        candidate = candidate_years[:, None]
+        required = required_years[None, :]
+        with np.errstate(divide='ignore', invalid='ignore'):
+            bonus = np.minimum((candidate - required) / required * 20, 20)
+            below = (candidate / required) * 100
+        
+        return np.where(
+            required == 0,
+            100.0,
+            np.where(candidate >= required, np.minimum(100.0 + bonus, 120.0), below)
+        )
+    
+    @staticmethod
+    def _education_score_matrix(candidate_rank: np.ndarray, required_rank: np.ndarray) -> np.ndarray:
+        """Vectorized equivalent of calculate_education_score"""
+        candidate = candidate_rank[:, None]
+        required = required_rank[None, :]
+        return np.select(
+            [required == 0, candidate >= required, candidate == required - 1, candidate == required - 2],
+            [100.0, 100.0, 75.0, 50.0],
+            default=25.0
+        )
+    
+    def score_encoded(self, resume_encoding: Dict, job_encoding: Dict) -> Dict[str, np.ndarray]:
+        """Score encoded resumes against encoded jobs, see score_matrix"""
+        skill_score = self._skill_score_matrix(resume_encoding, job_encoding)
+        text_similarity = self._text_similarity_matrix(resume_encoding, job_encoding)
+        experience_score = self._experience_score_matrix(
+            resume_encoding['experience_years'], job_encoding['min_experience']
+        )
+        education_score = self._education_score_matrix(
+            resume_encoding['education_rank'], job_encoding['education_rank']
+        )
+        
+        skill_weight, text_weight, experience_weight, education_weight = job_encoding['weights'][:, None, :]
+        overall_score = (
+            skill_score * skill_weight +
+            text_similarity * text_weight +
+            experience_score * experience_weight +
+            education_score * education_weight
+        )
+        
+        return {
+            'overall_score': np.minimum(overall_score, 100),
+            'skill_match_score': skill_score,
+            'text_similarity_score': text_similarity,
+            'experience_score': np.minimum(experience_score, 100),
+            'education_score': education_score
+        }
+    
+    def score_matrix(self, resumes: List[Dict], jobs: List[Dict]) -> Dict[str, np.ndarray]:
+        """
+        Score every resume against every job with array operations
+        
+        Args:
+            resumes: List of resume dictionaries, as passed to screen_resume
+            jobs: List of job dictionaries, as passed to screen_resume
+        
+        Returns:
+            Dictionary of (len(resumes), len(jobs)) arrays with the same
+            numeric scores screen_resume reports for each pair
+        """
+        job_encoding = self.encode_jobs(jobs)
+        resume_encoding = self.encode_resumes(resumes, job_encoding)
+        return self.score_encoded(resume_encoding, job_encoding)
+    
+    # ==================== Top-K Ranking ====================
+    
+    def rank_top_k(self, resumes: List[Dict], profile: JobProfile, k: int,
+                   load_texts: Callable[[List[int]], List[str]] = None,
+                   batch_size: int = 256) -> Dict:
+        """
+        Find the k best resumes for one job without scoring every text
+        
+        Skill, experience and education scores are cheap and computed for
+        every resume. Assuming a perfect text similarity gives an upper bound
+        on each overall score; resumes are visited in decreasing bound order
+        and the scan stops once no remaining bound can beat the current k-th
+        best score. The result is exactly the first k rows of the exhaustive
+        ranking (overall score descending, then input order).
+        
+        Args:
+            resumes: Resume dictionaries; 'text' may be omitted if load_texts is given
+            profile: Compiled job, see compile_job
+            k: Number of resumes to return
+            load_texts: Optional callback returning the texts of the given
+                resume indices, so texts are only fetched for scored resumes
+            batch_size: Resumes whose text similarity is computed together
+        
+        Returns:
+            Dictionary with 'indices' of the top resumes in rank order, their
+            score arrays as in score_matrix, and 'text_scored', the number of
+            resumes whose text similarity was computed
+        """
+        job_encoding = self.encode_profiles([profile])
+        features = self.encode_resume_features(resumes, job_encoding)
+        if load_texts is None:
+            load_texts = lambda indices: [resumes[index].get('text', '') for index in indices]
+        return self._rank_top_k_encoded(features, job_encoding, k, load_texts, batch_size)
+    
+    def rank_candidates(self, candidates: Dict, profile: JobProfile, k: int,
+                        load_texts: Callable[[List[int]], List[str]],
+                        batch_size: int = 256) -> Dict:
+        """rank_top_k over candidate columns instead of resume dictionaries"""
+        job_encoding = self.encode_profiles([profile])
+        features = self.encode_candidate_columns(candidates, job_encoding)
+        return self._rank_top_k_encoded(features, job_encoding, k, load_texts, batch_size)
+    
+    @staticmethod
+    def encode_candidate_columns(candidates: Dict, job_encoding: Dict) -> Dict:
+        """
+        encode_resume_features from candidate columns, without per-resume Python work
+        
+        Skills come either as 'skills', a CSR matrix over 'skill_names', or as
+        'skill_bits', indicators packed with np.packbits whose 'skill_rows'
+        belong to the candidates (CandidateTable.snapshot).
+        """
+        # Map the table's skill vocabulary onto the job skill vocabulary
+        skill_index = job_encoding['skill_index']
+        rows, columns = [], []
+        for row, name in enumerate(candidates['skill_names']):
+            column = skill_index.get(name.lower())
+            if column is not None:
+                rows.append(row)
+                columns.append(column)
+        mapping = sparse.csr_matrix(
+            (np.ones(len(rows)), (rows, columns)),
+            shape=(len(candidates['skill_names']), len(skill_index))
+        )
+        
+        if 'skill_bits' in candidates:
+            # Unpack only the job's skill columns out of the packed rows
+            used = np.flatnonzero(mapping.getnnz(axis=1))
+            packed = candidates['skill_bits'][np.ix_(candidates['skill_rows'], used // 8)]
+            bits = (packed >> (7 - used % 8).astype(np.uint8)) & 1
+            skills = sparse.csr_matrix(bits) @ mapping[used]
+        else:
+            skills = candidates['skills'] @ mapping
+        
+        experience_years = candidates['experience_years']
+        return {
+            # sign() collapses skills that differ only in case, as the dict encoding does
+            'skills': skills.sign().tocsr(),
+            'experience_years': np.where(np.isnan(experience_years), 0.0, experience_years),
+            'education_rank': candidates['education_rank'].astype(np.int64)
+        }
+    
+    def _rank_top_k_encoded(self, features: Dict, job_encoding: Dict, k: int,
+                            load_texts: Callable[[List[int]], List[str]], batch_size: int) -> Dict:
+        """Bound-based top-K search shared by rank_top_k and rank_candidates"""
+        skill_score = self._skill_score_matrix(features, job_encoding)[:, 0]
+        experience_score = self._experience_score_matrix(
+            features['experience_years'], job_encoding['min_experience']
+        )[:, 0]
+        education_score = self._education_score_matrix(
+            features['education_rank'], job_encoding['education_rank']
+        )[:, 0]
+        
+        skill_weight, text_weight, experience_weight, education_weight = job_encoding['weights'][:, 0]
+        
+        def overall(text_similarity, rows=slice(None)):
+            # Same expression as score_encoded, so the bound with a perfect
+            # text score is never below the real score under rounding
+            return np.minimum(
+                skill_score[rows] * skill_weight +
+                text_similarity * text_weight +
+                experience_score[rows] * experience_weight +
+                education_score[rows] * education_weight,
+                100
+            )
+        
+        # The slack absorbs text similarities a hair above 100 from the
+        # sklearn fallback path
+        upper_bound = overall(100.0) + 1e-9
+        indices = np.arange(len(skill_score))
+        visit_order = np.lexsort((indices, -upper_bound))
+        
+        text_similarity = np.zeros(len(skill_score), dtype=np.float64)
+        heap = []  # Min-heap of (score, -index): the root is the current k-th best
+        position = 0
+        while k > 0 and position < len(visit_order):
+            batch = []
+            while position < len(visit_order) and len(batch) < batch_size:
+                index = int(visit_order[position])
+                if len(heap) >= k and (upper_bound[index], -index) <= heap[0]:
+                    break
+                batch.append(index)
+                position += 1
+            if not batch:
+                break
+            
+            texts = load_texts(batch)
+            text_encoding = self.encode_resume_texts(texts, job_encoding)
+            text_similarity[batch] = self._text_similarity_matrix(text_encoding, job_encoding)[:, 0]
+            
+            batch_scores = overall(text_similarity[batch], batch)
+            for index, score in zip(batch, batch_scores):
+                entry = (float(score), -index)
+                if len(heap) < k:
+                    heapq.heappush(heap, entry)
+                elif entry > heap[0]:
+                    heapq.heapreplace(heap, entry)
+        
+        top = np.array([-negative_index for _, negative_index in sorted(heap, reverse=True)], dtype=np.int64)
+        return {
+            'indices': top,
+            'overall_score': overall(text_similarity[top], top),
+            'skill_match_score': skill_score[top],
+            'text_similarity_score': text_similarity[top],
+            'experience_score': np.minimum(experience_score, 100)[top],
+            'education_score': education_score[top],
+            'text_scored': position
+        }
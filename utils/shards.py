@@ -0,0 +1,274 @@
+import heapq
+import socket
+import struct
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, wait
+from itertools import islice
+from multiprocessing.connection import Connection, Listener, answer_challenge, deliver_challenge
+from typing import Dict, List, Optional, Tuple
+
+from models import Resume
+from utils.candidate_table import CandidateTable, shard_store_path
+from utils.job_profile import JobProfileCache
+from utils.ml_matcher import ResumeJobMatcher
+from utils.vector_store import ResumeVectorStore, FEATURE_SKILLS
+
+# Score fields of each ranked row, after the resume id
+RANK_FIELDS = ('overall_score', 'skill_match_score', 'text_similarity_score',
+               'experience_score', 'education_score')
+
+
+def shard_for(resume_id: int, num_shards: int) -> int:
+    """Shard owning a resume; the modulo hash can be evaluated in SQL"""
+    return resume_id % num_shards
+
+
+def parse_addresses(value: str) -> List[Tuple[str, int]]:
+    """Parse 'host:port,host:port' into Listener/Client addresses"""
+    addresses = []
+    for item in value.split(','):
+        if item.strip():
+            host, _, port = item.strip().rpartition(':')
+            addresses.append((host or '127.0.0.1', int(port)))
+    return addresses
+
+
+class ShardError(Exception):
+    """A shard failed to answer a request"""
+
+
+def set_deadline(connection: Connection, deadline: float) -> None:
+    """
+    Make blocking reads and writes on a socket connection fail at deadline
+
+    Connection does its own blocking I/O on the raw descriptor, so the limit
+    is set on the socket itself (SO_RCVTIMEO/SO_SNDTIMEO) rather than with
+    settimeout, which would switch the descriptor to non-blocking mode.
+    """
+    remaining = deadline - time.monotonic()
+    if remaining <= 0:
+        raise TimeoutError('deadline passed')
+    if sys.platform == 'win32':
+        value = struct.pack('L', max(1, int(remaining * 1000)))
+    else:
+        seconds = int(remaining)
+        value = struct.pack('ll', seconds, max(1, int((remaining - seconds) * 1e6)))
+    # fromfd duplicates the descriptor; options apply to the shared socket
+    with socket.fromfd(connection.fileno(), socket.AF_INET, socket.SOCK_STREAM) as sock:
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_RCVTIMEO, value)
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_SNDTIMEO, value)
+
+
+class ShardServer:
+    """
+    Serve rank requests for one shard over multiprocessing.connection
+
+    Each coordinator connection is handled on its own thread. Requests are
+    (operation, payload) tuples; replies are ('ok', result) or
+    ('error', message).
+    """
+
+    def __init__(self, app, shard_index: int, num_shards: int, address: Tuple[str, int],
+                 authkey: bytes, matcher: ResumeJobMatcher = None, cache_size: int = 256):
+        if not authkey:
+            raise ValueError('Shard servers require an authkey')
+        self.app = app
+        self.address = address
+        self.authkey = authkey
+        self.matcher = matcher or ResumeJobMatcher()
+        self.shard_index = shard_index
+        skill_list = app.config['COMMON_SKILLS']
+        store = ResumeVectorStore(
+            shard_store_path(app.config['VECTOR_STORE_PATH'], shard_index, num_shards),
+            dim=FEATURE_SKILLS + len(skill_list),
+            compact_ratio=app.config['VECTOR_STORE_COMPACT_RATIO']
+        )
+        self.candidates = CandidateTable(store, skill_list, partition=shard_for(Resume.id, num_shards) == shard_index)
+        self.profiles = JobProfileCache(cache_size)
+
+    def serve_forever(self) -> None:
+        with self.app.app_context():
+            self.candidates.load()
+        with Listener(self.address, authkey=self.authkey) as listener:
+            while True:
+                try:
+                    connection = listener.accept()
+                except (OSError, EOFError):
+                    # Failed handshake, e.g. a wrong authkey
+                    continue
+                threading.Thread(target=self._serve_connection, args=(connection,), daemon=True).start()
+
+    def _serve_connection(self, connection) -> None:
+        with connection:
+            while True:
+                try:
+                    operation, payload = connection.recv()
+                except (EOFError, OSError):
+                    return
+                try:
+                    with self.app.app_context():
+                        reply = ('ok', self.handle(operation, payload))
+                except Exception as e:
+                    reply = ('error', str(e))
+                connection.send(reply)
+
+    def handle(self, operation: str, payload: Dict) -> Dict:
+        if operation == 'ping':
+            return {'shard': self.shard_index, 'size': len(self.candidates)}
+        if operation == 'rank':
+            return self.rank(payload)
+        raise ValueError(f"Unknown shard operation '{operation}'")
+
+    def rank(self, payload: Dict) -> Dict:
+        """Top-K of this shard as (resume_id, *RANK_FIELDS) rows in rank order"""
+        self.candidates.refresh()
+        candidates = self.candidates.snapshot(payload.get('resume_ids'))
+
+        profile = self.profiles.get(
+            payload['job_id'], payload['revision'],
+            lambda: self.matcher.compile_job(payload['job'])
+        )
+
+        ids = candidates['ids']
+        k = payload.get('k') or len(ids)
+        scores = self.matcher.rank_candidates(candidates, profile, k, CandidateTable.text_loader(candidates))
+        rows = [
+            (int(ids[index]), *(float(scores[field][position]) for field in RANK_FIELDS))
+            for position, index in enumerate(scores['indices'])
+        ]
+        return {'shard': self.shard_index, 'total': len(ids), 'rankings': rows}
+
+
+class ShardCoordinator:
+    """
+    Fan rank requests out to shard servers and merge their top-K
+
+    Every shard ranks its own partition with the same tiebreak (score
+    descending, then resume id), so merging the per-shard top-K lists gives
+    the global top-K. Shards that fail or miss the timeout are reported in
+    failed_shards and the ranking covers the remaining shards. Connecting,
+    the authkey handshake and every read and write share the request
+    deadline, so an unresponsive shard never holds a pool thread past it.
+    """
+
+    def __init__(self, addresses: List[Tuple[str, int]], authkey: bytes, timeout: float = 5.0):
+        if not authkey:
+            raise ValueError('Shard connections require an authkey')
+        self.addresses = list(addresses)
+        self.authkey = authkey
+        self.timeout = timeout
+        self._idle = [[] for _ in self.addresses]  # Reusable connections per shard
+        self._lock = threading.Lock()
+        self._pool = ThreadPoolExecutor(max_workers=max(1, len(self.addresses)) * 4,
+                                        thread_name_prefix='shard-call')
+
+    def _checkout(self, shard: int, deadline: float) -> Connection:
+        with self._lock:
+            if self._idle[shard]:
+                return self._idle[shard].pop()
+        return self._connect(shard, deadline)
+
+    def _connect(self, shard: int, deadline: float) -> Connection:
+        """Open and authenticate a connection, giving up at deadline"""
+        sock = socket.create_connection(self.addresses[shard], timeout=max(0.001, deadline - time.monotonic()))
+        sock.settimeout(None)  # Connection needs a blocking descriptor
+        connection = Connection(sock.detach())
+        try:
+            # A listener that accepts but never answers cannot stall the handshake
+            set_deadline(connection, deadline)
+            answer_challenge(connection, self.authkey)
+            deliver_challenge(connection, self.authkey)
+        except BaseException:
+            connection.close()
+            raise
+        return connection
+
+    def _checkin(self, shard: int, connection) -> None:
+        with self._lock:
+            self._idle[shard].append(connection)
+
+    def _call(self, shard: int, operation: str, payload: Dict, deadline: float) -> Dict:
+        # Calls that waited in the pool past the deadline are not started
+        if time.monotonic() >= deadline:
+            raise TimeoutError(f'shard {shard} timed out')
+        try:
+            connection = self._checkout(shard, deadline)
+        except (BlockingIOError, socket.timeout):
+            raise TimeoutError(f'shard {shard} timed out')
+        try:
+            set_deadline(connection, deadline)
+            connection.send((operation, payload))
+            if not connection.poll(max(0.0, deadline - time.monotonic())):
+                raise TimeoutError(f'shard {shard} timed out')
+            status, result = connection.recv()
+        except BaseException as e:
+            # The connection may still receive a late reply, never reuse it
+            connection.close()
+            if isinstance(e, BlockingIOError):
+                raise TimeoutError(f'shard {shard} timed out')
+            raise
+        self._checkin(shard, connection)
+
+        if status != 'ok':
+            raise ShardError(result)
+        return result
+
+    def broadcast(self, operation: str, payload: Dict = None) -> Tuple[Dict[int, Dict], Dict[int, str]]:
+        """Send one request to every shard; returns (results, errors) keyed by shard"""
+        deadline = time.monotonic() + self.timeout
+        futures = {
+            self._pool.submit(self._call, shard, operation, payload, deadline): shard
+            for shard in range(len(self.addresses))
+        }
+        done, _ = wait(futures, timeout=self.timeout)
+
+        results, errors = {}, {}
+        for future, shard in futures.items():
+            if future not in done:
+                errors[shard] = 'timed out'
+            elif future.exception() is not None:
+                errors[shard] = str(future.exception()) or type(future.exception()).__name__
+            else:
+                results[shard] = future.result()
+        return results, errors
+
+    def ping(self) -> Tuple[Dict[int, Dict], Dict[int, str]]:
+        return self.broadcast('ping')
+
+    def rank(self, job_id: int, revision, job_data: Dict, k: Optional[int] = None,
+             resume_ids: Optional[List[int]] = None) -> Dict:
+        """
+        Rank resumes across all shards
+
+        Returns:
+            Dictionary with 'rankings' as (resume_id, *RANK_FIELDS) rows in
+            rank order, 'total' resumes considered and 'failed_shards'
+            mapping shard numbers to error messages
+        """
+        results, errors = self.broadcast('rank', {
+            'job_id': job_id,
+            'revision': revision,
+            'job': job_data,
+            'k': k,
+            'resume_ids': resume_ids
+        })
+
+        merged = heapq.merge(
+            *(result['rankings'] for result in results.values()),
+            key=lambda row: (-row[1], row[0])
+        )
+        return {
+            'rankings': list(islice(merged, k)) if k else list(merged),
+            'total': sum(result['total'] for result in results.values()),
+            'failed_shards': errors
+        }
+
+    def close(self) -> None:
+        self._pool.shutdown(wait=False)
+        with self._lock:
+            for connections in self._idle:
+                for connection in connections:
+                    connection.close()
+                connections.clear()
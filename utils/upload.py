@@ -0,0 +1,87 @@
+import hashlib
+import os
+import tempfile
+import zipfile
+from typing import BinaryIO, Optional, Tuple
+
+PDF_MAGIC = b'%PDF-'
+ZIP_MAGIC = b'PK\x03\x04'
+OLE_MAGIC = b'\xd0\xcf\x11\xe0\xa1\xb1\x1a\xe1'  # Legacy .doc (OLE2 compound file)
+SNIFF_BYTES = 1024
+TEMP_PREFIX = 'upload-'
+LEGACY_DOC_MESSAGE = 'Legacy .doc files are not supported. Please upload PDF or DOCX'
+
+
+class UploadRejected(Exception):
+    """Raised when an upload is refused before it reaches the parser"""
+
+    def __init__(self, message: str, status_code: int = 400):
+        super().__init__(message)
+        self.message = message
+        self.status_code = status_code
+
+
+def sniff_file_type(head: bytes) -> Optional[str]:
+    """Identify 'pdf', 'docx' or 'doc' from the leading bytes of a file"""
+    # The PDF spec allows junk before the header, readers look in the first 1KB
+    if PDF_MAGIC in head[:SNIFF_BYTES]:
+        return 'pdf'
+    if head.startswith(ZIP_MAGIC):
+        return 'docx'
+    if head.startswith(OLE_MAGIC):
+        return 'doc'
+    return None
+
+
+def is_docx(file_path: str) -> bool:
+    """Check that a ZIP archive is a Word document, reading only its central directory"""
+    try:
+        with zipfile.ZipFile(file_path) as archive:
+            return 'word/document.xml' in archive.namelist()
+    except zipfile.BadZipFile:
+        return False
+
+
+def stream_upload(stream: BinaryIO, dest_dir: str, expected_type: str, max_bytes: int,
+                  chunk_size: int = 64 * 1024) -> Tuple[str, str, int]:
+    """
+    Copy an upload to a temp file in chunks, hashing and validating it on the way
+
+    The content type is sniffed from the first chunk, so junk payloads are
+    rejected before the rest of the body is written. The temp file is removed
+    whenever the upload is rejected or copying fails.
+
+    Returns:
+        Tuple of (temp file path, sha256 hex digest, size in bytes)
+    """
+    fd, tmp_path = tempfile.mkstemp(dir=dest_dir, prefix=TEMP_PREFIX, suffix=f'.{expected_type}')
+    try:
+        digest = hashlib.sha256()
+        size = 0
+        with os.fdopen(fd, 'wb') as out:
+            head = stream.read(max(chunk_size, SNIFF_BYTES))
+            file_type = sniff_file_type(head)
+            if file_type == 'doc':
+                raise UploadRejected(LEGACY_DOC_MESSAGE)
+            if file_type is None:
+                raise UploadRejected('File content is not a PDF or DOCX document')
+            if file_type != expected_type:
+                raise UploadRejected(f'File content is {file_type.upper()} but the extension is .{expected_type}')
+
+            chunk = head
+            while chunk:
+                size += len(chunk)
+                if size > max_bytes:
+                    raise UploadRejected(f'File exceeds the maximum size of {max_bytes / (1024 * 1024):.1f}MB', 413)
+                digest.update(chunk)
+                out.write(chunk)
+                chunk = stream.read(chunk_size)
+
+        if file_type == 'docx' and not is_docx(tmp_path):
+            raise UploadRejected('File content is not a PDF or DOCX document')
+
+        return tmp_path, digest.hexdigest(), size
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
@@ -0,0 +1,282 @@
+import os
+import struct
+import numpy as np
+from contextlib import contextmanager
+from typing import Dict, Iterable, List, Tuple
+
+from utils.ml_matcher import ResumeJobMatcher
+
+try:
+    import fcntl
+except ImportError:  # Windows: single-process deployments only
+    fcntl = None
+
+# File layout: 64-byte header | int64 ids[capacity] | float32 features[capacity, FEATURE_SKILLS]
+# | uint8 skill_bits[capacity, ceil(skills / 8)], skill indicators packed big-endian as np.packbits
+MAGIC = b'RVEC'
+VERSION = 2
+HEADER = struct.Struct('<4sIIQQQ')  # magic, version, dim, capacity, count, deleted
+HEADER_SIZE = 64
+TOMBSTONE = -1
+
+# Leading columns of every feature vector, followed by one 0/1 column per skill
+FEATURE_EXPERIENCE = 0
+FEATURE_EDUCATION = 1
+FEATURE_SKILLS = 2
+
+
+def resume_feature_vector(resume_data: Dict, skill_list: List[str]) -> np.ndarray:
+    """
+    Encode a resume as a fixed-width float32 vector
+
+    Columns are experience years, education rank and one indicator per entry
+    of skill_list. The parser only reports skills from that list, so the
+    encoding is lossless for matching purposes.
+    """
+    vector = np.zeros(FEATURE_SKILLS + len(skill_list), dtype=np.float32)
+    vector[FEATURE_EXPERIENCE] = resume_data.get('experience_years', 0) or 0
+    vector[FEATURE_EDUCATION] = ResumeJobMatcher.EDUCATION_HIERARCHY.get(
+        (resume_data.get('education') or 'Not Specified').lower(), 0
+    )
+
+    resume_skills = {skill.lower() for skill in resume_data.get('skills', [])}
+    for column, skill in enumerate(skill_list):
+        if skill.lower() in resume_skills:
+            vector[FEATURE_SKILLS + column] = 1.0
+
+    return vector
+
+
+class ResumeVectorStore:
+    """
+    Append-only, memory-mapped store of resume feature vectors
+
+    Vectors come in as resume_feature_vector output; the two numeric columns
+    are kept as float32 and the skill indicators as packed bits, so a row of
+    the default 111 skills takes 30 bytes. All processes map the same file,
+    so they share one copy in the page cache.
+    Deletes only tombstone the id, so they never wait on a file rewrite;
+    space is reclaimed off the request path by compact(), which
+    rewrites the file and atomically swaps it in. Writers serialize on an
+    advisory lock file, and readers remap whenever the file is replaced.
+    """
+
+    def __init__(self, path: str, dim: int, initial_capacity: int = 1024,
+                 compact_ratio: float = 0.25):
+        self.path = path
+        self.dim = dim
+        self.skill_bytes = (dim - FEATURE_SKILLS + 7) // 8
+        self.row_size = 8 + 4 * FEATURE_SKILLS + self.skill_bytes
+        self.initial_capacity = max(1, initial_capacity)
+        self.compact_ratio = compact_ratio
+        self._map = None
+        self._inode = None
+
+        with self._locked():
+            if not os.path.exists(self.path) or self._read_header_from_disk()[0] != self.dim:
+                # Also replaces files of an older format; CandidateTable.load() refills them
+                self._write_file([], *self._pack(np.zeros((0, self.dim))), self.initial_capacity)
+
+    # ---------- file handling ----------
+
+    @contextmanager
+    def _locked(self):
+        """Hold the writer lock for the duration of the block"""
+        if fcntl is None:
+            yield
+            return
+        with open(self.path + '.lock', 'a') as lock_file:
+            fcntl.flock(lock_file, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+    def _read_header_from_disk(self) -> Tuple[int, int]:
+        """Return (dim, capacity) of the file on disk, or (-1, 0) if unreadable"""
+        try:
+            with open(self.path, 'rb') as f:
+                magic, version, dim, capacity, _, _ = HEADER.unpack(f.read(HEADER.size))
+        except (OSError, struct.error):
+            return -1, 0
+        if magic != MAGIC or version != VERSION:
+            return -1, 0
+        return dim, capacity
+
+    def _pack(self, vectors: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """Split feature vectors into (float32 numeric columns, packed skill bits)"""
+        vectors = np.asarray(vectors, dtype=np.float32).reshape(-1, self.dim)
+        return vectors[:, :FEATURE_SKILLS], np.packbits(vectors[:, FEATURE_SKILLS:] != 0, axis=1)
+
+    def _write_file(self, ids: Iterable[int], features: np.ndarray, skill_bits: np.ndarray,
+                    capacity: int) -> None:
+        """Write a fresh store file next to the current one and swap it in"""
+        ids = np.asarray(list(ids), dtype=np.int64)
+        capacity = max(capacity, len(ids), 1)
+        tmp_path = self.path + '.tmp'
+
+        with open(tmp_path, 'wb') as f:
+            f.write(HEADER.pack(MAGIC, VERSION, self.dim, capacity, len(ids), 0).ljust(HEADER_SIZE, b'\0'))
+            f.write(ids.tobytes())
+            f.write(np.full(capacity - len(ids), TOMBSTONE, dtype=np.int64).tobytes())
+            f.write(np.ascontiguousarray(features, dtype=np.float32).tobytes())
+            f.seek(capacity * 4 * FEATURE_SKILLS - len(ids) * 4 * FEATURE_SKILLS, os.SEEK_CUR)
+            f.write(np.ascontiguousarray(skill_bits, dtype=np.uint8).tobytes())
+            f.truncate(HEADER_SIZE + capacity * self.row_size)
+            f.flush()
+            os.fsync(f.fileno())
+
+        os.replace(tmp_path, self.path)
+        self._map = None
+
+    def _refresh(self) -> None:
+        """(Re)map the file if it has been replaced since we last mapped it"""
+        inode = os.stat(self.path).st_ino
+        if self._map is None or inode != self._inode:
+            self._map = np.memmap(self.path, dtype=np.uint8, mode='r+')
+            self._inode = inode
+
+    def _header(self) -> Tuple[int, int, int]:
+        """Return (capacity, count, deleted) from the mapped header"""
+        _, _, _, capacity, count, deleted = HEADER.unpack(self._map[:HEADER.size].tobytes())
+        return capacity, count, deleted
+
+    def _set_header(self, count: int, deleted: int) -> None:
+        capacity = self._header()[0]
+        self._map[:HEADER.size] = np.frombuffer(
+            HEADER.pack(MAGIC, VERSION, self.dim, capacity, count, deleted), dtype=np.uint8
+        )
+
+    def _arrays(self) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Return (ids, features, skill_bits) views over the full capacity of the mapping"""
+        capacity = self._header()[0]
+        ids_end = HEADER_SIZE + capacity * 8
+        features_end = ids_end + capacity * 4 * FEATURE_SKILLS
+        ids = self._map[HEADER_SIZE:ids_end].view(np.int64)
+        features = self._map[ids_end:features_end].view(np.float32).reshape(capacity, FEATURE_SKILLS)
+        skill_bits = self._map[features_end:features_end + capacity * self.skill_bytes]
+        return ids, features, skill_bits.reshape(capacity, self.skill_bytes)
+
+    # ---------- public API ----------
+
+    def snapshot(self) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Return (ids, features, skill_bits) views over the written rows
+
+        features holds the FEATURE_EXPERIENCE and FEATURE_EDUCATION columns and
+        skill_bits the skill indicators packed with np.packbits. The arrays
+        are backed by the shared mapping, not copied. Tombstoned rows are kept
+        in place with an id of TOMBSTONE.
+        """
+        self._refresh()
+        count = self._header()[1]
+        ids, features, skill_bits = self._arrays()
+        return ids[:count], features[:count], skill_bits[:count]
+
+    def footprint(self) -> Dict:
+        """Bytes per stored row, and the file's allocated bytes on disk"""
+        blocks = getattr(os.stat(self.path), 'st_blocks', None)
+        return {
+            'row_bytes': self.row_size,
+            'file_bytes': os.path.getsize(self.path),
+            'allocated_bytes': blocks * 512 if blocks is not None else os.path.getsize(self.path)
+        }
+
+    def live_count(self) -> int:
+        """Number of rows that have not been deleted"""
+        self._refresh()
+        _, count, deleted = self._header()
+        return count - deleted
+
+    def live_ids(self) -> np.ndarray:
+        """Copy of the ids of all rows that have not been deleted"""
+        ids = self.snapshot()[0]
+        return ids[ids != TOMBSTONE].copy()
+
+    def append(self, resume_id: int, vector: np.ndarray) -> bool:
+        """Append a vector for resume_id unless it is already stored"""
+        return self.append_many([(resume_id, vector)]) > 0
+
+    def append_many(self, items: Iterable[Tuple[int, np.ndarray]]) -> int:
+        """
+        Append (resume_id, vector) pairs, skipping ids already stored
+
+        Several processes may race to add the same new resume, so the check
+        and the write happen under the writer lock. Returns the number added.
+        """
+        items = list(items)
+        with self._locked():
+            self._refresh()
+            capacity, count, deleted = self._header()
+            ids = self._arrays()[0]
+            new_ids = np.fromiter((resume_id for resume_id, _ in items), dtype=np.int64, count=len(items))
+            # Look up only the incoming ids; tombstones never match a real id
+            stored = ids[:count]
+            already = stored[np.isin(stored, new_ids)]
+            _, first = np.unique(new_ids, return_index=True)
+            first = np.sort(first)
+            new_items = [items[i] for i in first[~np.isin(new_ids[first], already)]]
+            if not new_items:
+                return 0
+
+            if count + len(new_items) > capacity:
+                self._rewrite(capacity=max(2 * (count - deleted + len(new_items)), self.initial_capacity))
+                capacity, count, deleted = self._header()
+
+            ids, features, skill_bits = self._arrays()
+            end = count + len(new_items)
+            features[count:end], skill_bits[count:end] = self._pack([vector for _, vector in new_items])
+            ids[count:end] = [resume_id for resume_id, _ in new_items]
+            # Publish the rows last so readers never see a half-written entry
+            self._set_header(end, deleted)
+            self._map.flush()
+            return len(new_items)
+
+    def delete(self, resume_id: int) -> bool:
+        """Tombstone resume_id; the row's space is reclaimed by compact()"""
+        return self.delete_many([resume_id]) > 0
+
+    def delete_many(self, resume_ids: Iterable[int]) -> int:
+        """Tombstone every stored row of the given ids; returns the number removed"""
+        resume_ids = np.fromiter(resume_ids, dtype=np.int64)
+        with self._locked():
+            self._refresh()
+            capacity, count, deleted = self._header()
+            ids = self._arrays()[0]
+            rows = np.flatnonzero(np.isin(ids[:count], resume_ids))
+            if len(rows) == 0:
+                return 0
+
+            ids[rows] = TOMBSTONE
+            self._set_header(count, deleted + len(rows))
+            self._map.flush()
+            return len(rows)
+
+    def needs_compaction(self) -> bool:
+        """Whether more than compact_ratio of the written rows are tombstones"""
+        self._refresh()
+        _, count, deleted = self._header()
+        return deleted > self.compact_ratio * count
+
+    def compact(self) -> int:
+        """Drop tombstoned rows and return how many were removed"""
+        with self._locked():
+            self._refresh()
+            removed = self._header()[2]
+            self._rewrite(capacity=max(2 * self.live_count(), self.initial_capacity))
+            return removed
+
+    def rebuild(self, items: Iterable[Tuple[int, np.ndarray]]) -> None:
+        """Replace the whole store with the given (resume_id, vector) pairs"""
+        items = list(items)
+        ids = [resume_id for resume_id, _ in items]
+        features, skill_bits = self._pack([vector for _, vector in items])
+        with self._locked():
+            self._write_file(ids, features, skill_bits, max(2 * len(items), self.initial_capacity))
+
+    def _rewrite(self, capacity: int) -> None:
+        """Copy live rows into a new file of the given capacity (lock must be held)"""
+        ids, features, skill_bits = self.snapshot()
+        live = ids != TOMBSTONE
+        self._write_file(ids[live], features[live], skill_bits[live], capacity)
+        self._refresh()